@@ -0,0 +1,125 @@
+import os
+import random
+import time
+from array import array
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from economy import Economy
+from engine import MonopolyEngine
+from players import PlayerStore
+
+
+def capture(engine):
+    # Everything a rollout needs to carry on from the current position, as plain picklable data.
+    economy = engine.economy
+    players = engine.players
+    return (engine.board, players.names, players.player_nums.tolist(), players.positions.tolist(),
+            economy.cash.tolist(), economy.bankrupt.tolist(), economy.owner.tolist(), economy.mortgaged.tolist())
+
+
+def restore(state, seed):
+    board, names, player_nums, positions, cash, bankrupt, owner, mortgaged = state
+    players = PlayerStore(names, player_nums)
+    economy = Economy(board, players)
+    players.positions[:] = array("i", positions)
+    players.cash[:] = array("q", cash)
+    players.bankrupt[:] = array("B", bankrupt)
+    economy.load_ownership(owner, mortgaged)  # Also recounts the players still in the game.
+    return MonopolyEngine(players, board, seed=seed, economy=economy)
+
+
+def rollouts(state, player, position, buy, seeds, horizon):
+    # Plays one headless game per seed from the captured state after buying (or skipping)
+    # `position`, with every player buying whatever it can afford from then on, and
+    # returns the deciding player's net worth at the end of each game.
+    results = []
+    for seed in seeds:
+        engine = restore(state, seed)
+        economy = engine.economy
+        if buy:
+            economy.buy(player, position)
+        count = len(engine.players)
+        index = (player + 1) % count
+        while economy.bankrupt[index] and index != player:
+            index = (index + 1) % count
+        engine.current_player_index = index
+        engine.run(horizon)
+        results.append(economy.net_worth(player))
+    return results
+
+
+class RolloutDecision:
+    # One buy / skip decision in progress. poll() collects finished rollouts without
+    # blocking (or waits up to `timeout`) and returns None until the decision is made.
+    def __init__(self, ai, engine, player, position):
+        self.ai = ai
+        self.player = player
+        self.position = position
+        self.state = capture(engine)
+        self.deadline = time.perf_counter() + ai.time_budget
+        self.totals = {True: [0, 0], False: [0, 0]}  # Option -> [sum of net worth, rollouts].
+        self.pending = {}  # Future -> option it plays out.
+        # Keep two batches per option in flight per worker until the budget runs out.
+        for _ in range(ai.workers):
+            self.submit(True)
+            self.submit(False)
+
+    def submit(self, buy):
+        seeds = [self.ai.rng.getrandbits(64) for _ in range(self.ai.batch_size)]
+        future = self.ai.pool.submit(rollouts, self.state, self.player, self.position, buy, seeds, self.ai.horizon)
+        self.pending[future] = buy
+
+    def poll(self, timeout=0):
+        done, _ = wait(self.pending, timeout=timeout, return_when=FIRST_COMPLETED)
+        in_time = time.perf_counter() < self.deadline
+        for future in done:
+            buy = self.pending.pop(future)
+            results = future.result()
+            self.totals[buy][0] += sum(results)
+            self.totals[buy][1] += len(results)
+            if in_time:
+                self.submit(buy)
+        buy_total, buy_count = self.totals[True]
+        skip_total, skip_count = self.totals[False]
+        if in_time or not buy_count or not skip_count:
+            return None  # Past the budget, an option without any result yet is still waited for.
+        for future in self.pending:
+            future.cancel()  # Anything still running finishes in the background and is ignored.
+        self.ai.last_rollouts = buy_count + skip_count
+        return buy_total / buy_count >= skip_total / skip_count
+
+
+class RolloutPlayer:
+    # Decides buy / skip by playing many fast headless games from the current state in a
+    # process pool, within a fixed time budget per decision.
+    def __init__(self, time_budget=0.2, horizon=200, batch_size=16, workers=None, seed=None):
+        self.time_budget = time_budget  # Seconds per decision.
+        self.horizon = horizon  # Turns played in every rollout.
+        self.batch_size = batch_size  # Rollouts per task sent to a worker.
+        self.workers = workers or os.cpu_count() or 1
+        self.rng = random.Random(seed)  # Seeds for the rollouts.
+        self.last_rollouts = 0  # How many rollouts the last decision used.
+        # Started now, with one empty task per worker so the worker processes are up
+        # before the first decision rather than eating into its time budget.
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        for _ in range(self.workers):
+            self.pool.submit(int)
+
+    def start(self, engine, player, position):
+        # Submits the rollouts and returns at once; poll the returned decision.
+        return RolloutDecision(self, engine, player, position)
+
+    def decide(self, engine, player, position):
+        # Blocking version for headless callers.
+        if engine.economy.cash[player] < engine.economy.prices[position]:
+            return False
+        decision = self.start(engine, player, position)
+        while True:
+            answer = decision.poll(timeout=max(decision.deadline - time.perf_counter(), 0.01))
+            if answer is not None:
+                return answer
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
@@ -0,0 +1,188 @@
+import csv
+import json
+import os
+from itertools import islice
+
+from board import load_board, mauritian_slots
+from layout import board_extent, fit_slot_size, perimeter_layout
+from movement_log import closed_segments, iter_rows, open_segment, segment_paths
+
+
+def chunked(rows, chunk_rows):
+    while True:
+        chunk = list(islice(rows, chunk_rows))
+        if not chunk:
+            break
+        yield chunk
+
+
+def iter_chunks(path, chunk_rows=10_000):
+    # Reads player_movements.csv (as written by log_movement) and its rotated segments
+    # a chunk of rows at a time.
+    yield from chunked(iter_rows(path), chunk_rows)
+
+
+class MovementStats:
+    # Everything here is sized by the board and the number of distinct players,
+    # never by the number of moves, so a log of any length is read in constant memory.
+    # Players are told apart by name only, so player_visits adds up every game's
+    # "Player 1"; transitions stop at end_game() so they never join two games.
+    def __init__(self, board=mauritian_slots):
+        self.board = board  # The game board.
+        self.board_size = len(board)  # Total number of slots on the board.
+        self.moves = 0
+        self.slot_counts = [0] * self.board_size  # Landings per slot.
+        self.player_visits = {}  # Player name -> landings per slot.
+        self.transitions = [[0] * self.board_size for _ in range(self.board_size)]  # [from][to] counts.
+        self.last_position = {}  # Player name -> last slot seen, to count transitions.
+
+    def add_rows(self, rows):
+        for row in rows:
+            if not row:
+                continue
+            name, position = row[0], int(row[2])
+            self.moves += 1
+            self.slot_counts[position] += 1
+            visits = self.player_visits.get(name)
+            if visits is None:
+                visits = self.player_visits[name] = [0] * self.board_size
+            visits[position] += 1
+            previous = self.last_position.get(name)
+            if previous is not None:
+                self.transitions[previous][position] += 1
+            self.last_position[name] = position
+
+    def end_game(self):
+        # The next rows start a new game: its first landings are not moves from this one's last.
+        self.last_position.clear()
+
+    def group_counts(self):
+        counts = {}
+        for slot, count in zip(self.board, self.slot_counts):
+            group = slot["group"].strip()
+            counts[group] = counts.get(group, 0) + count
+        return counts
+
+    def player_distribution(self, name):
+        visits = self.player_visits[name]
+        total = sum(visits)
+        return [count / total for count in visits]
+
+
+def analyse(path, board=mauritian_slots, chunk_rows=10_000):
+    # The GUI starts a segment per game, so transitions are not counted across segments.
+    # (A size rotation in the middle of a game loses one transition per player.)
+    stats = MovementStats(board)
+    for segment in segment_paths(path):
+        with open_segment(segment) as file:
+            for chunk in chunked(csv.reader(file), chunk_rows):
+                stats.add_rows(chunk)
+        stats.end_game()
+    return stats
+
+
+def segment_counts(segment, chunk_rows=10_000):
+    # Landings per slot in one file of the log, as long as its highest position needs.
+    counts = []
+    with open_segment(segment) as file:
+        for chunk in chunked(csv.reader(file), chunk_rows):
+            for row in chunk:
+                if row:
+                    position = int(row[2])
+                    if position >= len(counts):
+                        counts.extend([0] * (position + 1 - len(counts)))
+                    counts[position] += 1
+    return counts
+
+
+def landing_counts(path, board_size, chunk_rows=10_000):
+    # Only the landings per slot, e.g. to seed the live heatmap in main.py. Rows from
+    # a log played on a bigger board are skipped. Closed segments never change, so their
+    # counts are kept in <log>.counts.json (keyed by file name, size and modification
+    # time) and only new segments and the live file are read.
+    cache_path = os.path.splitext(path)[0] + ".counts.json"
+    try:
+        with open(cache_path) as file:
+            cached = json.load(file)
+    except (OSError, ValueError):
+        cached = {}
+    kept = {}
+    totals = [0] * board_size
+    for _, segment in closed_segments(path):
+        info = os.stat(segment)
+        key = f"{os.path.basename(segment)}:{info.st_size}:{info.st_mtime_ns}"
+        counts = kept[key] = cached[key] if key in cached else segment_counts(segment, chunk_rows)
+        for position, count in enumerate(counts[:board_size]):
+            totals[position] += count
+    if os.path.exists(path):
+        for position, count in enumerate(segment_counts(path, chunk_rows)[:board_size]):
+            totals[position] += count
+    if kept != cached:
+        # Segments gone since (pruned) drop out of the cache with this rewrite.
+        try:
+            with open(cache_path + ".tmp", mode="w") as file:
+                json.dump(kept, file)
+            os.replace(cache_path + ".tmp", cache_path)
+        except OSError:
+            pass  # Read-only directory: just count everything again next time.
+    return totals
+
+
+def heat_color(count, highest):
+    # White for slots nobody landed on, deepening to red for the busiest slot.
+    level = count / highest if highest else 0.0
+    fade = int(255 * (1 - level))
+    return f"#ff{fade:02x}{fade:02x}"
+
+
+def draw_heatmap(canvas, board, counts, slot_size=None):
+    # Shades every slot by its landing count, on the same layout as draw_board.
+    slot_size = slot_size or fit_slot_size(len(board))
+    canvas.delete("all")
+    highest = max(counts)
+    corners = perimeter_layout(len(board), slot_size)
+    for (Row_1, Column_1), slot, count in zip(corners, board, counts):
+        canvas.create_rectangle(Row_1, Column_1, Row_1 + slot_size, Column_1 + slot_size,
+                                fill=heat_color(count, highest), outline="black")
+        if slot_size < 40:
+            continue
+        canvas.create_text(Row_1 + slot_size / 2, Column_1 + slot_size / 3, text=slot["name"].strip(), fill="black")
+        canvas.create_text(Row_1 + slot_size / 2, Column_1 + 2 * slot_size / 3, text=str(count), fill="black")
+
+
+def show_heatmap(board, counts, slot_size=None):
+    import tkinter as tk  # Only needed when a window is actually shown.
+
+    slot_size = slot_size or fit_slot_size(len(board))
+
+    root = tk.Tk()
+    root.title("Landing Heatmap")
+    extent = board_extent(len(board), slot_size)
+    canvas = tk.Canvas(root, width=extent, height=extent)
+    canvas.pack()
+    draw_heatmap(canvas, board, counts, slot_size)
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Landing statistics from a player_movements.csv log.")
+    parser.add_argument("path", nargs="?", default="player_movements.csv")
+    parser.add_argument("--show", action="store_true", help="draw the landing heatmap on the board")
+    parser.add_argument("--board", help="JSON or CSV board the log was played on (default: the Mauritian board)")
+    args = parser.parse_args()
+
+    stats = analyse(args.path, load_board(args.board) if args.board else mauritian_slots)
+    print(f"{stats.moves} moves")
+    for slot, count in zip(stats.board, stats.slot_counts):
+        print(f"{slot['name'].strip():<12} {slot['group'].strip():<10} {count}")
+    print()
+    for group, count in stats.group_counts().items():
+        print(f"{group:<12} {count}")
+    print()
+    for name in stats.player_visits:
+        busiest = max(range(stats.board_size), key=stats.player_distribution(name).__getitem__)
+        print(f"{name}: {sum(stats.player_visits[name])} moves, most often on {stats.board[busiest]['name'].strip()}")
+    if args.show:
+        show_heatmap(stats.board, stats.slot_counts)
@@ -0,0 +1,74 @@
+import random
+
+import numpy as np
+
+from board import mauritian_slots
+
+
+class BatchSimulator:
+    # Advances n_games independent games at once. Positions are an (n_games, n_players)
+    # array and the dice for a whole chunk of turns are drawn in one call. The dice
+    # stream is the one MonopolyEngine(seed=seed) would use, taken turn by turn and
+    # game by game, so n_games=1 reproduces the scalar engine exactly.
+    def __init__(self, n_games, n_players, board=mauritian_slots, seed=None):
+        self.board = board  # The game board.
+        self.board_size = len(board)  # Total number of slots on the board.
+        self.n_games = n_games
+        self.n_players = n_players
+        self.positions = np.zeros((n_games, n_players), dtype=np.int64)
+        self.current_player_index = 0  # Same for every game, they all move in lockstep.
+        self.turns = 0  # Turns played in each game.
+        self.landings = np.zeros(self.board_size, dtype=np.int64)  # Landings per slot over all games.
+
+        # Player numbers start at 1: even numbers move clockwise, odd numbers anti-clockwise.
+        player_nums = np.arange(1, n_players + 1)
+        self.steps = np.where(player_nums % 2 == 0, 1, -1)
+
+        # random.Random and NumPy's RandomState share the MT19937 generator, so copying
+        # the seeded state over gives the same numbers as the scalar engine.
+        state = random.Random(seed).getstate()[1]
+        self.rng = np.random.RandomState()
+        self.rng.set_state(("MT19937", np.array(state[:624], dtype=np.uint32), state[624]))
+
+    def roll_dice(self, turns):
+        # One row per turn, one column per game.
+        return (self.rng.random_sample((turns, self.n_games)) * 6).astype(np.int64) + 1
+
+    def run(self, turns, chunk_size=None):
+        if chunk_size is None:
+            chunk_size = max(1, (1 << 20) // self.n_games)  # Keep each chunk around 1M dice.
+        size = self.board_size
+        count = self.n_players
+
+        while turns > 0:
+            n = min(turns, chunk_size)
+            dice = self.roll_dice(n)
+            for offset in range(min(count, n)):
+                index = (self.current_player_index + offset) % count
+                # Every row of `walk` is one move of this player in all games.
+                walk = self.positions[:, index] + self.steps[index] * np.cumsum(dice[offset::count], axis=0)
+                walk %= size
+                self.landings += np.bincount(walk.ravel(), minlength=size)
+                self.positions[:, index] = walk[-1]
+            self.current_player_index = (self.current_player_index + n) % count
+            self.turns += n
+            turns -= n
+        return self.landings
+
+    def landing_frequencies(self):
+        total = self.landings.sum()
+        return self.landings / total if total else np.zeros(self.board_size)
+
+
+if __name__ == "__main__":
+    import time
+
+    simulator = BatchSimulator(n_games=10_000, n_players=4, seed=1)
+    turns = 1_000
+    start = time.perf_counter()
+    simulator.run(turns)
+    elapsed = time.perf_counter() - start
+    total = turns * simulator.n_games
+    print(f"{total} turns in {elapsed:.2f}s ({total / elapsed:,.0f} turns/sec)")
+    for slot, frequency in zip(simulator.board, simulator.landing_frequencies()):
+        print(f"{slot['name'].strip():<12} {slot['group'].strip():<10} {frequency:.4f}")
@@ -0,0 +1,225 @@
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from analytics import analyse
+from board import mauritian_slots
+from economy import Economy
+from engine import MonopolyEngine
+from layout import perimeter_layout, token_box
+from main import MonopolyGame
+from movement_log import MovementLogger
+from players import PlayerStore
+
+
+class StubCanvas:
+    # Stands in for tk.Canvas when there is no display: keeps the items in a dict so
+    # the Python side of draw_board is measured without Tk.
+    def __init__(self):
+        self.items = {}
+        self.next_id = 0
+
+    def _create(self, *coords, **options):
+        self.next_id += 1
+        self.items[self.next_id] = (coords, options)
+        return self.next_id
+
+    create_rectangle = create_text = create_oval = _create
+
+    def delete(self, tag):
+        self.items.clear()
+
+    def coords(self, item, *coords):
+        self.items[item] = (coords, self.items[item][1])
+
+    def config(self, **options):
+        pass
+
+    def itemconfig(self, item, **options):
+        pass
+
+
+def best_of(function, repeat=5):
+    # Lowest of several timings, the least disturbed by whatever else the machine is doing.
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def bench_turns(turns=1_000_000):
+    def plain():
+        MonopolyEngine(PlayerStore.numbered(4), seed=1).run(turns)
+
+    def with_economy():
+        players = PlayerStore.numbered(4)
+        MonopolyEngine(players, seed=1, economy=Economy(mauritian_slots, players)).run(turns)
+
+    results = {
+        "engine_turns_per_sec": turns / best_of(plain),
+        "economy_turns_per_sec": turns / best_of(with_economy),
+    }
+    try:
+        from batch import BatchSimulator
+    except ImportError:
+        return results  # NumPy is not installed.
+    games, batch_turns = 10_000, max(1, turns // 10_000)
+    results["batch_turns_per_sec"] = games * batch_turns / best_of(
+        lambda: BatchSimulator(games, 4, seed=1).run(batch_turns))
+    return results
+
+
+def board_game(canvas, n_players=8):
+    # A MonopolyGame with only the state draw_board and draw_token use, so no Tk root is needed.
+    game = MonopolyGame.__new__(MonopolyGame)
+    game.board = mauritian_slots
+    game.board_size = len(mauritian_slots)
+    game.slot_size = 55
+    game.slot_corners = perimeter_layout(game.board_size, game.slot_size)
+    game.token_box = token_box(game.slot_size)
+    game.player_colors = ["darkred", "black", "navy", "violet", "gray", "purple", "teal", "aqua"]
+    game.players = PlayerStore.numbered(n_players)
+    game.tokens = []
+    game.landing_counts = [0] * game.board_size
+    game.heat_scale = 1
+    game.show_heat = False
+    game.board_canvas = canvas
+    return game
+
+
+def bench_draw(calls=200, moves=20_000):
+    root = None
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+        canvas, backend = tk.Canvas(root), "tk"
+    except Exception:
+        canvas, backend = StubCanvas(), "stub"
+    try:
+        game = board_game(canvas)
+
+        def redraw():
+            for _ in range(calls):
+                game.draw_board()
+
+        def move_tokens():
+            for i in range(moves):
+                game.draw_token(i % len(game.players))
+
+        if root is not None:
+            root.update()
+        return {
+            "draw_backend": backend,
+            "draw_board_ms": best_of(redraw) / calls * 1e3,
+            "draw_token_us": best_of(move_tokens) / moves * 1e6,
+        }
+    finally:
+        if root is not None:
+            root.destroy()
+
+
+def bench_log(rows=200_000):
+    players = PlayerStore.numbered(4)
+    game = MonopolyGame.__new__(MonopolyGame)
+    game.board = mauritian_slots
+    game.players = players
+    with tempfile.TemporaryDirectory() as directory:
+        def write():
+            game.logger = MovementLogger(os.path.join(directory, "player_movements.csv"))
+            for i in range(rows):
+                players.positions[i % 4] = i % len(mauritian_slots)
+                game.log_movement(i % 4)
+            game.logger.close()
+
+        return {"log_rows_per_sec": rows / best_of(write, repeat=3)}
+
+
+def bench_memory(moves=1_000_000):
+    # Peak Python memory while writing a 1M-move log and while reading it back.
+    players = PlayerStore.numbered(4)
+    engine = MonopolyEngine(players, seed=1)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "player_movements.csv")
+        tracemalloc.start()
+        with MovementLogger(path) as logger:
+            for _ in range(moves):
+                _, index = engine.play_turn()
+                position = players.positions[index]
+                slot = mauritian_slots[position]
+                logger.log([players.names[index], players.player_nums[index], position,
+                            slot["name"], slot["group"], slot["color"], slot["price"]])
+        _, write_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        analyse(path)
+        _, read_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return {
+            "log_1m_file_mb": os.path.getsize(path) / 1e6,
+            "log_1m_write_peak_mb": write_peak / 1e6,
+            "log_1m_read_peak_mb": read_peak / 1e6,
+        }
+
+
+def bench_startup():
+    # Wall time of fresh interpreters: what the headless CLI costs to start, and what the
+    # GUI path adds by loading Tk and the rollout AI (it cannot open a window here).
+    here = os.path.dirname(os.path.abspath(__file__))
+
+    def command(*args):
+        return lambda: subprocess.run([sys.executable, *args], cwd=here, check=True, capture_output=True)
+
+    return {
+        "startup_python_ms": best_of(command("-c", "pass")) * 1e3,
+        "startup_headless_ms": best_of(command("main.py", "--headless", "--turns", "0")) * 1e3,
+        "startup_gui_imports_ms": best_of(command("-c", "import main, ai, tkinter.messagebox, tkinter.simpledialog")) * 1e3,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_all():
+    results = {
+        "commit": git_commit(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+    }
+    results.update(bench_turns())
+    results.update(bench_draw())
+    results.update(bench_log())
+    results.update(bench_memory())
+    results.update(bench_startup())
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the Monopoly engine, drawing and logging.")
+    parser.add_argument("--output", default="bench_results.json", help="JSON file the results are appended to")
+    args = parser.parse_args()
+
+    results = run_all()
+    for name, value in results.items():
+        print(f"{name:<24} {value:,.3f}" if isinstance(value, float) else f"{name:<24} {value}")
+
+    # One entry per run, so runs on different commits can be compared.
+    history = []
+    if os.path.exists(args.output):
+        with open(args.output) as file:
+            history = json.load(file)
+    history.append(results)
+    with open(args.output, mode="w") as file:
+        json.dump(history, file, indent=2)
@@ -0,0 +1,121 @@
+import csv
+import json
+import struct
+
+from board import load_board, mauritian_slots
+
+# File layout: MAGIC, a header (version, board JSON length) followed by the board
+# definition as JSON, then fixed-width records of player index, player number and
+# position. Slot names, groups, colours and prices live only in the header.
+MAGIC = b"MPLG"
+VERSION = 1
+HEADER = struct.Struct("<BI")
+RECORD = struct.Struct("<BBH")
+
+
+class BinaryMovementLog:
+    def __init__(self, path, board=mauritian_slots, buffer_size=4096):
+        self.buffer_size = buffer_size  # Records kept in memory before writing.
+        self.buffer = bytearray()
+        self.count = 0
+        self.file = open(path, mode="wb")
+        board_json = json.dumps(board, separators=(",", ":")).encode()
+        self.file.write(MAGIC + HEADER.pack(VERSION, len(board_json)) + board_json)
+
+    def log(self, player_index, player_num, position):
+        self.buffer += RECORD.pack(player_index, player_num, position)
+        self.count += 1
+        if self.count >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        self.file.write(self.buffer)
+        self.buffer.clear()
+        self.count = 0
+
+    def close(self):
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_header(file):
+    if file.read(len(MAGIC)) != MAGIC:
+        raise ValueError("not a binary movement log")
+    version, board_length = HEADER.unpack(file.read(HEADER.size))
+    if version != VERSION:
+        raise ValueError(f"unsupported binary movement log version {version}")
+    return json.loads(file.read(board_length))
+
+
+def iter_records(path, chunk_records=65536):
+    # Yields (player_index, player_num, position) while holding one chunk in memory.
+    with open(path, mode="rb") as file:
+        read_header(file)
+        chunk_size = chunk_records * RECORD.size
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            yield from RECORD.iter_unpack(chunk)
+
+
+def read_board(path):
+    with open(path, mode="rb") as file:
+        return read_header(file)
+
+
+def replay(path):
+    # Yields (player_index, player_num, slot) for every move, in the order they were made.
+    board = read_board(path)
+    for player_index, player_num, position in iter_records(path):
+        yield player_index, player_num, board[position]
+
+
+def landing_counts(path):
+    counts = [0] * len(read_board(path))
+    for _, _, position in iter_records(path):
+        counts[position] += 1
+    return counts
+
+
+def csv_to_binary(csv_path, binary_path, board=mauritian_slots):
+    # Converts a player_movements.csv written by log_movement. Player numbers start at 1,
+    # so the player index is the player number minus one.
+    count = 0
+    with open(csv_path, newline="") as file, BinaryMovementLog(binary_path, board) as log:
+        for row in csv.reader(file):
+            if not row:
+                continue
+            player_num, position = int(row[1]), int(row[2])
+            log.log(player_num - 1, player_num, position)
+            count += 1
+    return count
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Convert and summarise binary movement logs.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    convert = subparsers.add_parser("convert", help="convert player_movements.csv to the binary format")
+    convert.add_argument("csv_path")
+    convert.add_argument("binary_path")
+    convert.add_argument("--board", help="JSON or CSV board the log was played on (default: the Mauritian board)")
+    stats = subparsers.add_parser("stats", help="print landing counts per slot")
+    stats.add_argument("binary_path")
+    args = parser.parse_args()
+
+    if args.command == "convert":
+        board = load_board(args.board) if args.board else mauritian_slots
+        print(f"Converted {csv_to_binary(args.csv_path, args.binary_path, board)} moves")
+    else:
+        board = read_board(args.binary_path)
+        for slot, count in zip(board, landing_counts(args.binary_path)):
+            print(f"{slot['name'].strip():<12} {slot['group'].strip():<10} {count}")
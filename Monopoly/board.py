@@ -0,0 +1,86 @@
+import csv
+import json
+import os
+
+mauritian_slots = [
+    {"name": "Go", "group": "      Special", "color": "palegreen1", "price": "Rs 0"},
+    {"name": "Flacq", "group": "      Group 1", "color": "brown", "price": "Rs 0"},
+    {"name": "Cpe1", "group": "      Group 1", "color": "brown", "price": "Rs 60"},
+    {"name": "    C.Chest1", "group": "      Special", "color": "hotpink", "price": "Rs 0"},
+    {"name": "MBG1", "group": "      Railroad", "color": "springgreen4", "price": "Rs 200"},
+    {"name": "Flac1", "group": "      Group 1", "color": "brown", "price": "Rs 60"},
+    {"name": "Tax", "group": "      Special", "color": "blueviolet", "price": "Rs 0"},
+    {"name": " G.Baie", "group": "      Group 2", "color": "light blue", "price": "Rs 100"},
+    {"name": "   Chance1", "group": "      Special", "color": "steelblue", "price": "Rs 0"},
+    {"name": "   R.Hill1", "group": "      Group 2", "color": "light blue", "price": "Rs 100"},
+    {"name": "      Q.Bornes", "group": "      Group 2", "color": "light blue", "price": "Rs 120"},
+    {"name": "Visit", "group": "      Special", "color": "palegreen3", "price": "Rs 0"},
+    {"name": "P.L1", "group": "      Group 3", "color": "pink", "price": "Rs 140"},
+    {"name": "      Electricity", "group": "      Utility", "color": "gold", "price": "Rs 150"},
+    {"name": "      B.Bassin1", "group": "      Railroad", "color": "springgreen4", "price": "Rs 140"},
+    {"name": "    Vacoas", "group": "       Group 3", "color": "pink", "price": "Rs 160"},
+    {"name": " Moka", "group": "     Group 3", "color": "pink", "price": "Rs 200"},
+    {"name": " Tayack", "group": "      Group 4", "color": "orange", "price": "Rs 180"},
+    {"name": "    C.Chest2", "group": "      Special", "color": "hotpink", "price": "Rs 0"},
+    {"name": "    R.Belle", "group": "      Group 4", "color": "orange", "price": "Rs 180"},
+    {"name": "Mbg", "group": "      Group 4", "color": "orange", "price": "Rs 200"},
+    {"name": "Park", "group": "      Special", "color": "blueviolet", "price": "Rs 0"},
+    {"name": "B.Air", "group": "      Group 5", "color": "red", "price": "Rs 220"},
+    {"name": "   Chance2", "group": "      Special", "color": "steelblue", "price": "Rs 0"},
+    {"name": "  G.Port", "group": "      Group 5", "color": "red", "price": "Rs 220"},
+    {"name": " Metro", "group": "      Railroad", "color": "springgreen4", "price": "Rs 200"},
+    {"name": " R.Hill2", "group": "      Group 5", "color": "red", "price": "Rs 240"},
+    {"name": " B.River", "group": "      Group 6", "color": "yellow", "price": "Rs 260"},
+    {"name": "    Rempart", "group": "      Group 6", "color": "yellow", "price": "Rs 260"},
+    {"name": " Water", "group": "   Utility", "color": "gold", "price": "Rs 150"},
+    {"name": " Albion", "group": "      Group 6", "color": "yellow", "price": "Rs 280"},
+    {"name": "Cpe2", "group": "     Group 7", "color": "green", "price": "Rs 300"},
+    {"name": "RDA2", "group": "      Group 7", "color": "green", "price": "Rs 300"},
+    {"name": "    C.Chest3", "group": "      Special", "color": "hotpink", "price": "Rs 0"},
+    {"name": "P.L2", "group": "      Group 7", "color": "green", "price": "Rs 320"},
+    {"name": "RDA2", "group": "      Railroad", "color": "springgreen4", "price": "Rs 200"},
+    {"name": "    Chance3", "group": "      Special", "color": "steelblue", "price": "Rs 0"},
+    {"name": "Pl3", "group": "      Group 8", "color": "blue", "price": "Rs 350"},
+    {"name": "Tax", "group": "      Special", "color": "blueviolet", "price": "Rs 0"},
+    {"name": "Flac2", "group": "      Group 8", "color": "blue", "price": "Rs 400"},
+    {"name": "Flac3", "group": "      Group 8", "color": "blue", "price": "Rs 400"},
+    {"name": "Flac4", "group": "      Group 8", "color": "blue", "price": "Rs 400"},
+]
+
+
+SLOT_FIELDS = ("name", "group", "color", "price")
+DEFAULTS = {"group": "Special", "color": "white", "price": "Rs 0"}
+
+
+def make_slot(fields):
+    # One board slot in the same shape as mauritian_slots; only the name is required.
+    if not fields.get("name"):
+        raise ValueError(f"slot without a name: {fields!r}")
+    slot = {key: fields.get(key) or DEFAULTS[key] for key in SLOT_FIELDS[1:]}
+    slot["name"] = fields["name"]
+    # Checked here, where the file is known, rather than failing later in compile_board.
+    amount = str(slot["price"]).split()
+    if not amount or not amount[-1].isdigit() or isinstance(slot["price"], float):
+        raise ValueError(f"slot {fields['name']!r}: price {slot['price']!r} is not a whole number of rupees")
+    slot["price"] = f"Rs {int(amount[-1])}"  # Plain numbers get the currency like the built-in board.
+    return slot
+
+
+def load_board(path):
+    # A custom board from a JSON file (a list of slot objects) or a CSV file with a
+    # name,group,color,price header. Slot 0 is Go; any number of slots (4 or more) works.
+    if os.path.splitext(path)[1].lower() == ".csv":
+        with open(path, newline="") as file:
+            rows = list(csv.DictReader(file))
+    else:
+        with open(path) as file:
+            rows = json.load(file)
+    board = []
+    for number, row in enumerate(rows):
+        try:
+            board.append(make_slot(row))
+        except ValueError as error:
+            raise ValueError(f"{path}: slot {number}: {error}") from None
+    if len(board) < 4:
+        raise ValueError(f"{path}: a board needs at least 4 slots, got {len(board)}")
+    return board
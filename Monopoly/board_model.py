@@ -0,0 +1,60 @@
+from array import array
+
+from board import mauritian_slots
+
+KINDS = ("Railroad", "Utility", "Special")  # Groups that are not colour sets.
+
+
+def parse_price(price):
+    # "Rs 60" -> 60; plain numbers are passed through.
+    if isinstance(price, int):
+        return price
+    return int(price.split()[-1])
+
+
+class CompiledBoard:
+    # The board dicts parsed once: names and groups stripped of layout padding, prices
+    # as integers and groups interned as small integer ids, with the lookups the game
+    # logic needs precomputed.
+    __slots__ = ("size", "names", "colors", "prices", "group_ids", "group_names",
+                 "group_positions", "kind_positions")
+
+    def __init__(self, board):
+        self.size = len(board)
+        self.names = tuple(slot["name"].strip() for slot in board)
+        self.colors = tuple(slot["color"] for slot in board)
+        self.prices = array("i", (parse_price(slot["price"]) for slot in board))
+
+        self.group_names = []  # Group id -> display name.
+        group_index = {}
+        self.group_ids = array("H")  # Slot position -> group id (boards may have more than 255 groups).
+        for slot in board:
+            name = slot["group"].strip()
+            if name not in group_index:
+                group_index[name] = len(self.group_names)
+                self.group_names.append(name)
+            self.group_ids.append(group_index[name])
+        self.group_names = tuple(self.group_names)
+
+        positions = [[] for _ in self.group_names]
+        for position, group_id in enumerate(self.group_ids):
+            positions[group_id].append(position)
+        self.group_positions = tuple(tuple(slots) for slots in positions)  # Group id -> slot positions.
+        self.kind_positions = {kind: self.group_positions[group_index[kind]] if kind in group_index else ()
+                               for kind in KINDS}  # "Railroad" / "Utility" / "Special" -> slot positions.
+
+
+_compiled = {}  # Slot fields of a board -> its CompiledBoard.
+MAX_COMPILED = 64  # Distinct boards kept; the cache starts over beyond that.
+
+
+def compile_board(board=mauritian_slots):
+    # Cached by content rather than identity: every process-pool task unpickles its own
+    # copy of the same board, and each copy must not add an entry that lives forever.
+    key = tuple((slot["name"], slot["group"], slot["color"], slot["price"]) for slot in board)
+    compiled = _compiled.get(key)
+    if compiled is None:
+        if len(_compiled) >= MAX_COMPILED:
+            _compiled.clear()
+        compiled = _compiled[key] = CompiledBoard(board)
+    return compiled
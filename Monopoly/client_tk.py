@@ -0,0 +1,165 @@
+import json
+import queue
+import socket
+import threading
+import tkinter as tk
+from array import array
+from tkinter import messagebox, simpledialog
+
+from board import mauritian_slots
+from economy import Economy
+from engine import MonopolyEngine
+from main import MonopolyGame
+from players import PlayerStore
+
+
+class NoLogger:
+    # The server plays the moves, so the client has nothing to log.
+    def log(self, row):
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class ServerConnection:
+    # Sends requests as JSON lines; a reader thread puts every reply and broadcast on a queue.
+    def __init__(self, host, port):
+        self.socket = socket.create_connection((host, port))
+        self.file = self.socket.makefile("rwb")
+        self.messages = queue.Queue()
+        threading.Thread(target=self.read_loop, name="server-reader", daemon=True).start()
+
+    def send(self, message):
+        self.file.write(json.dumps(message).encode() + b"\n")
+        self.file.flush()
+
+    def request(self, message):
+        # Only used before the reader thread has anything else to deliver (the first join).
+        self.send(message)
+        return self.messages.get()
+
+    def read_loop(self):
+        for line in self.file:
+            self.messages.put(json.loads(line))
+        self.messages.put(None)  # The server closed the connection.
+
+    def close(self):
+        self.socket.close()
+
+
+class RemoteGame(MonopolyGame):
+    # The Tk board as a renderer of the server's game: rolling sends a request, and the
+    # board is updated from the moves and states the server sends back.
+    def __init__(self, root, connection, board, state, player=None):
+        self.connection = connection
+        self.player = player  # Our player index, or None when watching.
+        super().__init__(root, PlayerStore(state["names"]), board, logger=NoLogger())
+        self.save_button.pack_forget()  # Saving is the server's business.
+        self.load_button.pack_forget()
+        self.apply_state(state)
+        self.root.after(50, self.poll)
+
+    def roll_dice(self):
+        self.connection.send({"op": "roll"})  # Without "buy": the server offers what we land on.
+
+    def poll(self):
+        while True:
+            try:
+                message = self.connection.messages.get_nowait()
+            except queue.Empty:
+                break
+            if message is None:
+                self.dice_value.config(text="Disconnected")
+                return
+            self.handle(message)
+        self.root.after(50, self.poll)
+
+    def handle(self, message):
+        if not message.get("ok"):
+            self.dice_value.config(text=message.get("error", ""))
+        elif "state" in message:
+            self.apply_state(message["state"])
+        elif message.get("event") == "moved":
+            self.apply_move(message)
+            if message.get("offer") is not None and message["player"] == self.player:
+                self.offer_purchase(message["offer"])
+        elif message.get("event") == "bought":
+            self.apply_purchase(message)
+
+    def offer_purchase(self, position):
+        name = self.players.names[self.player]
+        price = self.economy.prices[position]
+        buy = messagebox.askyesno("Buy", f"{name}, buy {self.board[position]['name'].strip()} for Rs {price}?")
+        self.connection.send({"op": "buy", "buy": buy})
+
+    def apply_purchase(self, message):
+        position = message["position"]
+        self.economy.cash[:] = array("q", message["cash"])
+        self.economy.owner[position] = message["owner"]
+        self.economy.load_ownership(self.economy.owner, self.economy.mortgaged)
+        self.draw_owner(position)
+        self.show_cash()
+
+    def apply_move(self, move):
+        index, position = move["player"], move["position"]
+        self.dice_value.config(text=str(move["dice"]))
+        if index >= len(self.players):
+            self.connection.send({"op": "state"})  # Someone joined that we have not seen yet.
+            return
+        self.players.positions[index] = position
+        self.economy.cash[:] = array("q", move["cash"])
+        self.count_landing(position)
+        self.draw_token(index)
+        if self.economy.owner[position] != move["owner"]:
+            self.economy.owner[position] = move["owner"]
+            self.economy.load_ownership(self.economy.owner, self.economy.mortgaged)
+            self.draw_owner(position)
+        if list(self.economy.bankrupt) != move["bankrupt"]:
+            self.connection.send({"op": "state"})  # Ownership changed all over the board.
+        self.show_cash()
+
+    def apply_state(self, state):
+        if state["names"] != self.players.names:
+            # New players joined: rebuild the local view and redraw the board for them.
+            self.players = PlayerStore(state["names"])
+            self.economy = Economy(self.board, self.players)
+            self.engine = MonopolyEngine(self.players, self.board, economy=self.economy)
+            self.draw_board()
+        if state.get("started"):
+            self.players.positions[:] = array("i", state["positions"])
+            self.players.cash[:] = array("q", state["cash"])
+            self.players.bankrupt[:] = array("B", state["bankrupt"])
+            self.economy.load_ownership(state["owner"], state["mortgaged"])
+        for i in range(len(self.players)):
+            self.draw_token(i)
+            self.board_canvas.itemconfig(self.tokens[i], state="hidden" if self.players.bankrupt[i] else "normal")
+        for position in range(self.board_size):
+            self.draw_owner(position)
+        self.show_cash()
+
+    def close(self):
+        self.connection.close()
+        super().close()
+
+
+def main():
+    root = tk.Tk()
+    host = simpledialog.askstring("Input", "Server address:", initialvalue="127.0.0.1")
+    room = simpledialog.askstring("Input", "Room:", initialvalue="room1")
+    name = simpledialog.askstring("Input", "Your name (leave empty to watch):")
+
+    connection = ServerConnection(host, 8765)
+    reply = connection.request({"op": "join", "room": room, "name": name or ""})
+    if not reply["ok"]:
+        messagebox.showerror("Join", reply["error"])
+        return
+    RemoteGame(root, connection, mauritian_slots, reply["state"], reply["player"])
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import math
+
+from board import load_board, mauritian_slots
+from engine import MonopolyEngine
+from players import PlayerStore
+
+Z_95 = 1.959964  # Two-sided 95% quantile of the normal distribution.
+
+
+class BatchMeans:
+    # Running mean and variance (Welford) of every slot's landing frequency across
+    # batches of turns. Batches of thousands of turns are long enough to be
+    # treated as independent samples, so the spread of the batch frequencies gives a
+    # confidence interval for each slot's long-run frequency.
+    def __init__(self, size):
+        self.size = size
+        self.batches = 0
+        self.mean = [0.0] * size
+        self.m2 = [0.0] * size  # Sum of squared deviations from the mean.
+
+    def add(self, counts):
+        total = sum(counts)
+        self.batches += 1
+        n = self.batches
+        mean, m2 = self.mean, self.m2
+        for slot, count in enumerate(counts):
+            x = count / total
+            delta = x - mean[slot]
+            mean[slot] += delta / n
+            m2[slot] += delta * (x - mean[slot])
+
+    def half_widths(self, z=Z_95):
+        # Half the width of every slot's confidence interval: t * sqrt(variance / batches),
+        # with Student's t from its first-order expansion around the normal quantile z,
+        # since the variance itself comes from only a few dozen batches.
+        n = self.batches
+        if n < 2:
+            return [math.inf] * self.size
+        t = z + (z ** 3 + z) / (4 * (n - 1))
+        scale = t / math.sqrt(n * (n - 1))
+        return [scale * math.sqrt(m2) for m2 in self.m2]
+
+
+def run_until_converged(simulator, tolerance=0.0005, batch_turns=10_000, min_batches=10, max_turns=None, z=Z_95):
+    # Runs `simulator` (a MonopolyEngine or a batch.BatchSimulator) in batches of about
+    # batch_turns moves in total, split across a BatchSimulator's games, until every slot's
+    # landing frequency is known to within +/- tolerance, or max_turns turns per game have
+    # been played (the last batch is cut short to fit), or the game is over. Returns how
+    # many turns per game that took together with the estimates.
+    stats = BatchMeans(len(simulator.landings))
+    step = max(batch_turns // getattr(simulator, "n_games", 1), 1)  # Turns per game in each batch.
+    start_turns = simulator.turns
+    previous = list(simulator.landings)
+    converged = False
+    while True:
+        turns = step if max_turns is None else min(step, start_turns + max_turns - simulator.turns)
+        if turns <= 0:
+            break
+        before = simulator.turns
+        simulator.run(turns)
+        if simulator.turns - before < turns:
+            break  # Only one player left: the batch is short and the game cannot go on.
+        current = list(simulator.landings)
+        stats.add([now - then for now, then in zip(current, previous)])
+        previous = current
+        if stats.batches >= min_batches and max(stats.half_widths(z)) <= tolerance:
+            converged = True
+            break
+    half_widths = stats.half_widths(z)
+    return {
+        "converged": converged,
+        "turns": simulator.turns - start_turns,  # Per game for a BatchSimulator.
+        "batches": stats.batches,
+        "frequencies": stats.mean,
+        "half_widths": half_widths,
+        "max_half_width": max(half_widths),
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Estimate landing frequencies, stopping once they have converged.")
+    parser.add_argument("--tolerance", type=float, default=0.0005, help="largest 95%% half-width accepted per slot")
+    parser.add_argument("--batch-turns", type=int, default=10_000, help="moves per batch, across all games")
+    parser.add_argument("--max-turns", type=int, default=None, help="most turns played in each game")
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--games", type=int, default=1, help="games played side by side with NumPy (batch.py)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--board", help="JSON or CSV board to play on (default: the Mauritian board)")
+    args = parser.parse_args()
+    board = load_board(args.board) if args.board else mauritian_slots
+
+    if args.games > 1:
+        from batch import BatchSimulator
+
+        simulator = BatchSimulator(args.games, args.players, board, seed=args.seed)
+    else:
+        simulator = MonopolyEngine(PlayerStore.numbered(args.players), board, seed=args.seed)
+    start = time.perf_counter()
+    result = run_until_converged(simulator, args.tolerance, args.batch_turns, max_turns=args.max_turns)
+    elapsed = time.perf_counter() - start
+    print(f"{'Converged' if result['converged'] else 'Stopped'} after {result['turns']} turns"
+          f"{f' in each of {args.games} games' if args.games > 1 else ''} ({result['batches']} batches, "
+          f"{elapsed:.2f}s), widest interval +/-{result['max_half_width']:.5f}")
+    for slot, frequency, half_width in zip(board, result["frequencies"], result["half_widths"]):
+        print(f"{slot['name'].strip():<12} {slot['group'].strip():<10} {frequency:.4f} +/- {half_width:.4f}")
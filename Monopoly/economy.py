@@ -0,0 +1,176 @@
+from array import array
+
+from board_model import compile_board
+
+START_CASH = 1500  # Cash every player starts with.
+GO_SALARY = 200  # Collected when a move lands on or passes Go.
+
+# What happened on a landing, returned by Economy.on_land.
+NOTHING, BOUGHT, RENT, BANKRUPT = range(4)
+
+
+def buy_if_affordable(economy, player, position):
+    # Default purchase policy for headless games: buy whenever the cash is there.
+    return economy.cash[player] >= economy.prices[position]
+
+
+class Economy:
+    # Buy / rent / mortgage rules on top of the movement engine. Ownership is kept
+    # per player and per group as a bitset with one bit per slot of the group, and the
+    # rent is a lookup by (slot, number of bits set in the owner's bitset for the group),
+    # which doubles a colour set's rent once every bit is set; nothing on a landing
+    # scans the board.
+    def __init__(self, board, players, start_cash=START_CASH, buy_policy=buy_if_affordable):
+        model = compile_board(board)
+        self.model = model
+        self.buy_policy = buy_policy  # Called as buy_policy(economy, player, position) -> bool.
+        self.prices = model.prices
+        self.group_ids = model.group_ids
+        n_players = len(players)
+        self.cash = players.cash  # Shared with the players.PlayerStore.
+        self.bankrupt = players.bankrupt
+        for i in range(n_players):
+            self.cash[i] = start_cash
+            self.bankrupt[i] = 0
+        self.active_players = n_players
+        self.owner = array("b", [-1] * model.size)  # -1 while the bank owns the slot.
+        self.mortgaged = array("B", [0] * model.size)
+
+        # What kind of rent each slot charges; Special slots and free slots cannot be bought.
+        railroad = model.kind_positions["Railroad"]
+        utility = model.kind_positions["Utility"]
+        self.railroad_group = model.group_ids[railroad[0]] if railroad else -1
+        self.utility_group = model.group_ids[utility[0]] if utility else -1
+        special = set(model.kind_positions["Special"])
+        self.for_sale = array("B", (1 if price > 0 and i not in special else 0 for i, price in enumerate(model.prices)))
+
+        # Slot -> its bit inside the group bitset. Only slots for sale get a bit: a free
+        # slot in a group (Flacq) can never be owned, so it must not keep the rest of its
+        # group from being a monopoly.
+        self.bits = [0] * model.size
+        self.group_sizes = [0] * len(model.group_names)  # Slots for sale per group.
+        for group_id, positions in enumerate(model.group_positions):
+            buyable = [position for position in positions if self.for_sale[position]]
+            for k, position in enumerate(buyable):
+                self.bits[position] = 1 << k
+            self.group_sizes[group_id] = len(buyable)
+        self.owned = [[0] * len(model.group_names) for _ in range(n_players)]
+
+        self.dice_rent = array("B", (1 if group_id == self.utility_group else 0 for group_id in model.group_ids))
+        self.rent_table = [self.rent_row(position) for position in range(model.size)]
+
+    def rent_row(self, position):
+        # Rent of a slot by how many slots of its group the owner holds (0 .. slots of the
+        # group for sale). Utility rents are per pip of the dice roll.
+        group_id = self.group_ids[position]
+        group_size = self.group_sizes[group_id]
+        row = array("i")
+        for count in range(group_size + 1):
+            if group_id == self.railroad_group:
+                rent = 25 << min(count - 1, 3) if count else 0  # 25, 50, 100, 200 and no higher.
+            elif group_id == self.utility_group:
+                rent = 10 if count == group_size else 4
+            else:
+                rent = max(self.prices[position] // 10, 2)
+                if count == group_size:
+                    rent *= 2  # The owner has the whole colour set.
+            row.append(rent)
+        return row
+
+    def rent(self, position, dice_value):
+        owner = self.owner[position]
+        if owner < 0 or self.mortgaged[position]:
+            return 0
+        rent = self.rent_table[position][self.owned[owner][self.group_ids[position]].bit_count()]
+        return rent * dice_value if self.dice_rent[position] else rent
+
+    def on_land(self, player, position, dice_value, passed_go=False):
+        if passed_go:
+            self.cash[player] += GO_SALARY
+        owner = self.owner[position]
+        if owner < 0:
+            if self.for_sale[position] and self.buy_policy(self, player, position):
+                return BOUGHT if self.buy(player, position) else NOTHING
+            return NOTHING
+        if owner == player:
+            return NOTHING
+        rent = self.rent(position, dice_value)
+        if not rent:
+            return NOTHING
+        return RENT if self.pay(player, rent, owner) else BANKRUPT
+
+    def buy(self, player, position):
+        price = self.prices[position]
+        if self.owner[position] >= 0 or not self.for_sale[position] or self.cash[player] < price:
+            return False
+        self.cash[player] -= price
+        self.owner[position] = player
+        self.owned[player][self.group_ids[position]] |= self.bits[position]
+        return True
+
+    def pay(self, player, amount, creditor=None):
+        # Mortgages what it has to; a player who still cannot pay goes bankrupt.
+        if self.cash[player] < amount:
+            self.raise_cash(player, amount)
+        if self.cash[player] < amount:
+            self.go_bankrupt(player, creditor)
+            return False
+        self.cash[player] -= amount
+        if creditor is not None:
+            self.cash[creditor] += amount
+        return True
+
+    def mortgage(self, player, position):
+        if self.owner[position] != player or self.mortgaged[position]:
+            return False
+        self.mortgaged[position] = 1
+        self.cash[player] += self.prices[position] // 2
+        return True
+
+    def load_ownership(self, owner, mortgaged):
+        # Restores who owns what (e.g. from a saved game) and rebuilds the group bitsets.
+        self.owner[:] = array("b", owner)
+        self.mortgaged[:] = array("B", mortgaged)
+        for owned in self.owned:
+            owned[:] = [0] * len(owned)
+        for position, player in enumerate(self.owner):
+            if player >= 0:
+                self.owned[player][self.group_ids[position]] |= self.bits[position]
+        self.active_players = len(self.bankrupt) - sum(self.bankrupt)
+
+    def net_worth(self, player):
+        if self.bankrupt[player]:
+            return 0
+        worth = self.cash[player]
+        for position in self.properties(player):
+            price = self.prices[position]
+            worth += price // 2 if self.mortgaged[position] else price
+        return worth
+
+    def properties(self, player):
+        return [position for position, owner in enumerate(self.owner) if owner == player]
+
+    def raise_cash(self, player, amount):
+        # Only runs when a player is short, so scanning their properties here is fine.
+        for position in self.properties(player):
+            if self.cash[player] >= amount:
+                break
+            self.mortgage(player, position)
+
+    def go_bankrupt(self, player, creditor=None):
+        # Everything goes to the creditor, or back to the bank (unmortgaged) when there is none.
+        for position in self.properties(player):
+            bit = self.bits[position]
+            group_id = self.group_ids[position]
+            self.owned[player][group_id] &= ~bit
+            if creditor is None:
+                self.owner[position] = -1
+                self.mortgaged[position] = 0
+            else:
+                self.owner[position] = creditor
+                self.owned[creditor][group_id] |= bit
+        if creditor is not None:
+            self.cash[creditor] += self.cash[player]
+        self.cash[player] = 0
+        self.bankrupt[player] = 1
+        self.active_players -= 1
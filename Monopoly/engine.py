@@ -0,0 +1,154 @@
+import random
+from array import array
+from itertools import accumulate
+
+from board import mauritian_slots
+from economy import GO_SALARY
+from players import PlayerStore
+
+
+class MonopolyEngine:
+    def __init__(self, players, board=mauritian_slots, seed=None, economy=None):
+        self.players = players  # players.PlayerStore with every player's state.
+        self.board = board  # The game board.
+        self.board_size = len(board)  # Total number of slots on the board.
+        self.current_player_index = 0  # Index to track the current player.
+        self.turns = 0  # Number of turns played so far.
+        self.rng = random.Random(seed)  # Own RNG so runs are reproducible for a given seed.
+        self.landings = [0] * self.board_size  # How many times each slot has been landed on.
+        self.economy = economy  # Optional economy.Economy; None only moves tokens.
+        self.last_event = None  # What the economy did on the last landing.
+        self.steps = players.steps  # +1 clockwise (even player numbers), -1 anti-clockwise.
+
+    def roll_dice(self):
+        return int(self.rng.random() * 6) + 1  # Dice value between 1 and 6.
+
+    def move_player(self, dice_value):
+        index = self.current_player_index
+        positions = self.players.positions
+        start = positions[index]
+        moved = start + self.steps[index] * dice_value
+        position = positions[index] = moved % self.board_size
+        self.landings[position] += 1
+        next_index = (index + 1) % len(self.players)  # Move to the next player.
+        economy = self.economy
+        if economy is not None:
+            passed_go = moved >= self.board_size or moved <= 0 < start
+            self.last_event = economy.on_land(index, position, dice_value, passed_go)
+            while economy.bankrupt[next_index] and next_index != index:
+                next_index = (next_index + 1) % len(self.players)  # Bankrupt players sit out.
+        self.current_player_index = next_index
+        self.turns += 1
+        return index
+
+    def play_turn(self):
+        # Returns the dice value and the index of the player who moved.
+        dice_value = self.roll_dice()
+        return dice_value, self.move_player(dice_value)
+
+    def run(self, turns, chunk_size=65536):
+        # Same result as calling play_turn() `turns` times, but the dice are drawn in
+        # chunks and every player walks through its own share of the chunk in one go.
+        if self.economy is not None:
+            return self._run_with_economy(turns)
+        rand = self.rng.random
+        size = self.board_size
+        landings = self.landings
+        count = len(self.players)
+        positions = self.players.positions.tolist()
+
+        while turns > 0:
+            n = min(turns, chunk_size)
+            dice = [int(rand() * 6) + 1 for _ in range(n)]
+            for offset in range(min(count, n)):
+                index = (self.current_player_index + offset) % count
+                moves = dice[offset::count]
+                if self.steps[index] < 0:
+                    moves = [-d for d in moves]
+                walk = accumulate(moves, initial=positions[index])
+                next(walk)  # Skip the starting position.
+                pos = positions[index]
+                for total in walk:
+                    pos = total % size
+                    landings[pos] += 1
+                positions[index] = pos
+            self.current_player_index = (self.current_player_index + n) % count
+            self.turns += n
+            turns -= n
+
+        self.players.positions[:] = array("i", positions)
+        return landings
+
+    def _run_with_economy(self, turns):
+        # Cash moves between players, so turns have to be played in order. This is
+        # move_player() with everything in locals and rent that the player can afford
+        # paid inline; the economy is only called to buy a slot or when the player is
+        # short of cash. Stops early once only one player is left.
+        economy = self.economy
+        rand = self.rng.random
+        size = self.board_size
+        steps = self.steps
+        landings = self.landings
+        owner = economy.owner
+        owned = economy.owned
+        group_ids = economy.group_ids
+        mortgaged = economy.mortgaged
+        rent_table = economy.rent_table
+        dice_rent = economy.dice_rent
+        for_sale = economy.for_sale
+        bankrupt = economy.bankrupt
+        cash = economy.cash
+        on_land = economy.on_land
+        count = len(self.players)
+        positions = self.players.positions.tolist()
+        index = self.current_player_index
+
+        played = 0
+        while played < turns and economy.active_players > 1:
+            dice_value = int(rand() * 6) + 1
+            start = positions[index]
+            moved = start + steps[index] * dice_value
+            pos = moved % size
+            positions[index] = pos
+            landings[pos] += 1
+            if moved >= size or moved <= 0 < start:
+                cash[index] += GO_SALARY
+            holder = owner[pos]
+            if holder < 0:
+                if for_sale[pos]:
+                    on_land(index, pos, dice_value)
+            elif holder != index and not mortgaged[pos]:
+                rent = rent_table[pos][owned[holder][group_ids[pos]].bit_count()]
+                if dice_rent[pos]:
+                    rent *= dice_value
+                if cash[index] >= rent:
+                    cash[index] -= rent
+                    cash[holder] += rent
+                else:
+                    on_land(index, pos, dice_value)
+            index = (index + 1) % count
+            while bankrupt[index]:
+                index = (index + 1) % count  # Bankrupt players sit out.
+            played += 1
+
+        self.current_player_index = index
+        self.turns += played
+        self.players.positions[:] = array("i", positions)
+        return landings
+
+    def landing_frequencies(self):
+        total = sum(self.landings)
+        return [count / total if total else 0.0 for count in self.landings]
+
+
+if __name__ == "__main__":
+    import time
+
+    engine = MonopolyEngine(PlayerStore.numbered(4), seed=1)
+    turns = 2_000_000
+    start = time.perf_counter()
+    engine.run(turns)
+    elapsed = time.perf_counter() - start
+    print(f"{turns} turns in {elapsed:.2f}s ({turns / elapsed:,.0f} turns/sec)")
+    for slot, frequency in zip(engine.board, engine.landing_frequencies()):
+        print(f"{slot['name'].strip():<12} {slot['group'].strip():<10} {frequency:.4f}")
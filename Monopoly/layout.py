@@ -0,0 +1,51 @@
+from functools import lru_cache
+
+
+def grid_cells(board_length):
+    # Number of cells along one side of the square board: each side holds a
+    # quarter of the slots plus the corner it shares with the next side.
+    return -(-board_length // 4) + 1
+
+
+@lru_cache(maxsize=None)
+def perimeter_layout(board_length, slot_size):
+    # Top-left pixel corner of every slot, computed once per board length and slot size.
+    # Slot 0 sits just left of the bottom-right corner, then the slots run along the
+    # bottom row to the left, up the left column, right along the top row and down the
+    # right column, ending on the bottom-right corner.
+    side = grid_cells(board_length) - 1  # Steps from one corner to the next.
+    corners = []
+    for i in range(board_length):
+        edge, step = divmod(i, side)
+        if edge == 0:
+            # Bottom row
+            column, row = side - 1 - step, side
+        elif edge == 1:
+            # Left column
+            column, row = 0, side - 1 - step
+        elif edge == 2:
+            # Top row
+            column, row = step + 1, 0
+        else:
+            # Right column
+            column, row = side, step + 1
+        corners.append((column * slot_size, row * slot_size))
+    return tuple(corners)
+
+
+def token_box(slot_size):
+    # 10 to 30 pixels into a 55-pixel slot; on tiny slots the token fills the slot.
+    if slot_size < 40:
+        return 0, slot_size
+    return slot_size * 2 // 11, slot_size * 6 // 11
+
+
+def board_extent(board_length, slot_size):
+    # Width and height in pixels of the whole board.
+    return grid_cells(board_length) * slot_size
+
+
+def fit_slot_size(board_length, extent=660, smallest=4):
+    # Largest slot size that keeps the whole board within extent pixels (660 fits the
+    # 42-slot board at the original 55 pixels per slot).
+    return max(extent // grid_cells(board_length), smallest)
@@ -0,0 +1,50 @@
+import asyncio
+import json
+import time
+
+
+async def play_room(host, port, room, n_players, deadline, counts):
+    # One connection plays every player of its own room, one roll at a time.
+    reader, writer = await asyncio.open_connection(host, port)
+
+    async def request(message):
+        writer.write(json.dumps(message).encode() + b"\n")
+        await writer.drain()
+        return json.loads(await reader.readline())
+
+    try:
+        for i in range(n_players):
+            reply = await request({"op": "join", "room": room, "name": f"Player {i + 1}"})
+            if not reply["ok"]:
+                raise RuntimeError(reply["error"])
+        while time.perf_counter() < deadline:
+            reply = await request({"op": "roll", "buy": True})
+            if not reply["ok"]:
+                break  # Game over.
+            counts[0] += 1
+    finally:
+        writer.close()
+
+
+async def run_load(host="127.0.0.1", port=8765, rooms=100, n_players=4, duration=10.0):
+    counts = [0]
+    start = time.perf_counter()
+    deadline = start + duration
+    await asyncio.gather(*(play_room(host, port, f"load-{i}", n_players, deadline, counts) for i in range(rooms)))
+    elapsed = time.perf_counter() - start
+    return counts[0], elapsed
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Measure rolls per second against a running server.py.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--rooms", type=int, default=100)
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--duration", type=float, default=10.0)
+    args = parser.parse_args()
+
+    rolls, elapsed = asyncio.run(run_load(args.host, args.port, args.rooms, args.players, args.duration))
+    print(f"{args.rooms} rooms, {rolls} rolls in {elapsed:.2f}s ({rolls / elapsed:,.0f} rolls/sec)")
@@ -1,68 +1,80 @@
-import random
+import argparse
 import csv
-import tkinter as tk
-from tkinter import simpledialog
-
-mauritian_slots = [
-    {"name": "Go", "group": "      Special", "color": "palegreen1", "price": "Rs 0"},
-    {"name": "Flacq", "group": "      Group 1", "color": "brown", "price": "Rs 0"},
-    {"name": "Cpe1", "group": "      Group 1", "color": "brown", "price": "Rs 60"},
-    {"name": "    C.Chest1", "group": "      Special", "color": "hotpink", "price": "Rs 0"},
-    {"name": "MBG1", "group": "      Railroad", "color": "springgreen4", "price": "Rs 200"},
-    {"name": "Flac1", "group": "      Group 1", "color": "brown", "price": "Rs 60"},
-    {"name": "Tax", "group": "      Special", "color": "blueviolet", "price": "Rs 0"},
-    {"name": " G.Baie", "group": "      Group 2", "color": "light blue", "price": "Rs 100"},
-    {"name": "   Chance1", "group": "      Special", "color": "steelblue", "price": "Rs 0"},
-    {"name": "   R.Hill1", "group": "      Group 2", "color": "light blue", "price": "Rs 100"},
-    {"name": "      Q.Bornes", "group": "      Group 2", "color": "light blue", "price": "Rs 120"},
-    {"name": "Visit", "group": "      Special", "color": "palegreen3", "price": "Rs 0"},
-    {"name": "P.L1", "group": "      Group 3", "color": "pink", "price": "Rs 140"},
-    {"name": "      Electricity", "group": "      Utility", "color": "gold", "price": "Rs 150"},
-    {"name": "      B.Bassin1", "group": "      Railroad", "color": "springgreen4", "price": "Rs 140"},
-    {"name": "    Vacoas", "group": "       Group 3", "color": "pink", "price": "Rs 160"},
-    {"name": " Moka", "group": "     Group 3", "color": "pink", "price": "Rs 200"},
-    {"name": " Tayack", "group": "      Group 4", "color": "orange", "price": "Rs 180"},
-    {"name": "    C.Chest2", "group": "      Special", "color": "hotpink", "price": "Rs 0"},
-    {"name": "    R.Belle", "group": "      Group 4", "color": "orange", "price": "Rs 180"},
-    {"name": "Mbg", "group": "      Group 4", "color": "orange", "price": "Rs 200"},
-    {"name": "Park", "group": "      Special", "color": "blueviolet", "price": "Rs 0"},
-    {"name": "B.Air", "group": "      Group 5", "color": "red", "price": "Rs 220"},
-    {"name": "   Chance2", "group": "      Special", "color": "steelblue", "price": "Rs 0"},
-    {"name": "  G.Port", "group": "      Group 5", "color": "red", "price": "Rs 220"},
-    {"name": " Metro", "group": "      Railroad", "color": "springgreen4", "price": "Rs 200"},
-    {"name": " R.Hill2", "group": "      Group 5", "color": "red", "price": "Rs 240"},
-    {"name": " B.River", "group": "      Group 6", "color": "yellow", "price": "Rs 260"},
-    {"name": "    Rempart", "group": "      Group 6", "color": "yellow", "price": "Rs 260"},
-    {"name": " Water", "group": "   Utility", "color": "gold", "price": "Rs 150"},
-    {"name": " Albion", "group": "      Group 6", "color": "yellow", "price": "Rs 280"},
-    {"name": "Cpe2", "group": "     Group 7", "color": "green", "price": "Rs 300"},
-    {"name": "RDA2", "group": "      Group 7", "color": "green", "price": "Rs 300"},
-    {"name": "    C.Chest3", "group": "      Special", "color": "hotpink", "price": "Rs 0"},
-    {"name": "P.L2", "group": "      Group 7", "color": "green", "price": "Rs 320"},
-    {"name": "RDA2", "group": "      Railroad", "color": "springgreen4", "price": "Rs 200"},
-    {"name": "    Chance3", "group": "      Special", "color": "steelblue", "price": "Rs 0"},
-    {"name": "Pl3", "group": "      Group 8", "color": "blue", "price": "Rs 350"},
-    {"name": "Tax", "group": "      Special", "color": "blueviolet", "price": "Rs 0"},
-    {"name": "Flac2", "group": "      Group 8", "color": "blue", "price": "Rs 400"},
-    {"name": "Flac3", "group": "      Group 8", "color": "blue", "price": "Rs 400"},
-    {"name": "Flac4", "group": "      Group 8", "color": "blue", "price": "Rs 400"},
-]
+import json
+import os
+import sys
+from time import perf_counter_ns
+
+from analytics import heat_color, landing_counts
+from board import load_board, mauritian_slots
+from economy import BANKRUPT, BOUGHT, Economy
+from engine import MonopolyEngine
+from layout import board_extent, fit_slot_size, perimeter_layout, token_box
+from movement_log import MovementLogger
+from players import PlayerStore
+from profiler import TurnProfiler
+from snapshot import restore_into, resume_or_start, run_checkpointed, write_snapshot
+
+# Tk (and the rollout AI's process pool) are imported only when a window is opened, so
+# the headless path (python main.py --headless) starts fast and works without a display.
+
+
 class MonopolyGame:
-    def __init__(self, root, players, board):
+    def __init__(self, root, players, board, logger=None, ai_players=(), profiler=None):
         self.root = root  # The Tkinter root window.
-        self.players = players  # List of players.
+        self.ai_players = set(ai_players)  # Indexes of the computer-controlled players.
+        self.ai = None  # ai.RolloutPlayer making their buy / skip decisions.
+        if self.ai_players:
+            from ai import RolloutPlayer
+            self.ai = RolloutPlayer()
+        self.economy = Economy(board, players, buy_policy=self.ask_to_buy)  # Cash, ownership and rent.
+        self.engine = MonopolyEngine(players, board, economy=self.economy)  # Headless game logic; the UI only displays it.
+        # Landings per slot for the heatmap overlay, seeded once from the log so far (read
+        # before the default logger starts a new segment).
+        log_path = getattr(logger, "path", None) if logger is not None else "player_movements.csv"
+        self.landing_counts = landing_counts(log_path, len(board)) if log_path else [0] * len(board)
+        # Power of two >= the busiest slot's count: the overlay's full red.
+        self.heat_scale = 1 << (max(self.landing_counts) - 1).bit_length() if max(self.landing_counts) > 1 else 1
+        self.show_heat = False
+        # Buffered player_movements.csv writer; each game starts a new segment, old ones are gzipped
+        # and only the newest 50 are kept, so the log stays bounded however many games are played.
+        self.logger = logger if logger is not None else MovementLogger(max_bytes=16_000_000, compression="gzip",
+                                                                       max_segments=50, new_segment=True)
+        self.players = players  # players.PlayerStore with every player's state.
         self.board = board  # The game board.
-        self.current_player_index = 0  # Index to track the current player.
         self.board_size = len(board)  # Total number of slots on the board.
+        self.slot_size = fit_slot_size(self.board_size)  # Slots shrink so any board fits the same canvas.
+        self.slot_corners = perimeter_layout(self.board_size, self.slot_size)  # Top-left pixel of every slot.
+        self.token_box = token_box(self.slot_size)  # Token offsets inside a slot.
+        self.tokens = []  # Canvas ids of the player tokens.
+        self.player_colors = ["darkred", "black", "navy", "violet", "gray", "purple", "teal", "aqua"]  # Define a list of player colors
+        self.frame_ms = 80  # Time each animation frame (one slot of a move) stays on screen.
+        self.max_queued_rolls = 1  # Rolls accepted while a move is still animating.
+        self.queued_rolls = 0
+        self.animation_job = None  # Pending root.after id while a token is moving.
+        self.pending_buy = None  # (player, position) a computer player is still deciding on.
+        self.profiler = profiler  # profiler.TurnProfiler timing each phase of a turn, or None.
         self.setup_ui()
 
+    @property
+    def current_player_index(self):
+        return self.engine.current_player_index  # Index to track the current player.
+
     def setup_ui(self):
+        import tkinter as tk
+
         self.root.title("Monopoly Game")
+        self.root.protocol("WM_DELETE_WINDOW", self.close)  # Flush the movement log before the window goes.
 
         # Create a button to roll the dice and link it to the roll_dice method.
         self.roll_button = tk.Button(self.root, text="Roll Dice", command=self.roll_dice)
         self.roll_button.pack(pady=10)
 
+        # Save the game mid-way and load it back.
+        self.save_button = tk.Button(self.root, text="Save Game", command=self.save_game)
+        self.save_button.pack()
+        self.load_button = tk.Button(self.root, text="Load Game", command=self.load_game)
+        self.load_button.pack()
 
         self.dice_label = tk.Label(self.root, text="Dice Roll: ", font=("Helvetica", 12))
         self.dice_label.pack()
@@ -70,113 +82,374 @@ class MonopolyGame:
         self.dice_value = tk.Label(self.root, text="", font=("Helvetica", 12))
         self.dice_value.pack()
 
+        self.cash_label = tk.Label(self.root, text="", font=("Helvetica", 12))
+        self.cash_label.pack()
+
+        # Shade the slots by how often they have been landed on.
+        self.heat_button = tk.Button(self.root, text="Heatmap", command=self.toggle_heat)
+        self.heat_button.pack()
+
         # Create a canvas to draw the game board.
-        self.board_canvas = tk.Canvas(self.root, width=600, height=600) # w..16cm & h..16cm in pixel
+        extent = board_extent(self.board_size, self.slot_size)  # Just big enough for the board.
+        self.board_canvas = tk.Canvas(self.root, width=extent, height=extent)
         self.board_canvas.pack()
 
-        self.draw_board()  # Draw the initial board.
+        self.draw_board()  # Draw the board and the tokens once.
+        self.show_cash()
+        self.schedule_ai_turn()
+        self.flush_log()
+
+        if self.profiler is not None:
+            # Debug overlay with the phase timings, refreshed once a second rather than per move.
+            self.profile_label = tk.Label(self.root, text="", font=("Courier", 9), justify="left")
+            self.profile_label.pack()
+            self.show_profile()
 
     def roll_dice(self):
-        dice_value = random.randint(1, 6)  # Generate a random dice value between 1 and 6.
+        if self.economy.active_players < 2:
+            return  # The game is over.
+        if self.animation_job is not None:
+            # A token is still moving: remember the click, or refuse it once the queue is full.
+            if self.queued_rolls < self.max_queued_rolls:
+                self.queued_rolls += 1
+            else:
+                self.root.bell()
+            return
+        index = self.current_player_index
+        if self.profiler is None:
+            dice_value = self.engine.roll_dice()
+        else:
+            start = perf_counter_ns()
+            dice_value = self.engine.roll_dice()
+            self.profiler.record("dice", start, perf_counter_ns())
         self.dice_value.config(text=str(dice_value))  # Update the dice value label.
-        player = self.players[self.current_player_index]  # Get the current player.
-        if player["player_num"] % 2 == 0:  # Check if the player number is even.
-            self.move_player_clockwise(dice_value)
+        # Walk the token one slot per frame; the move itself is applied when it arrives.
+        step = self.players.steps[index]
+        start = self.players.positions[index]
+        path = [(start + step * k) % self.board_size for k in range(1, dice_value + 1)]
+        self.animate(index, dice_value, path, 0)
+
+    def animate(self, index, dice_value, path, frame):
+        self.place_token(index, path[frame])
+        if frame + 1 < len(path):
+            self.animation_job = self.root.after(self.frame_ms, self.animate, index, dice_value, path, frame + 1)
+        else:
+            self.animation_job = self.root.after(self.frame_ms, self.finish_move, dice_value)
+
+    def finish_move(self, dice_value):
+        self.animation_job = None
+        if self.profiler is None:
+            index = self.engine.move_player(dice_value)  # Move the current player.
+            self.log_movement(index)  # Log the player's movement.
+            self.draw_move(index)
         else:
-            self.move_player_anti_clockwise(dice_value)
-
-    def move_player_clockwise(self, dice_value):
-        player = self.players[self.current_player_index]  # Get the current player.
-        player["position"] = (player["position"] + dice_value) % self.board_size  # Update the player's position clockwise.
-        self.log_movement(player)  # Log the player's movement.
-        self.current_player_index = (self.current_player_index + 1) % len(self.players)  # Move to the next player.
-        self.draw_board()  # Redraw the board to update player positions.
-
-    def move_player_anti_clockwise(self, dice_value):
-        player = self.players[self.current_player_index]  # Get the current player.
-        player["position"] = (player["position"] - dice_value) % self.board_size  # Update the player's position anti-clockwise.
-        self.log_movement(player)  # Log the player's movement.
-        self.current_player_index = (self.current_player_index + 1) % len(self.players)  # Move to the next player.
-        self.draw_board()  # Redraw the board to update player positions.
-
-    def log_movement(self, player):
-        slot = self.board[player["position"]]  # Get the slot where the player landed.
-
-        with open('player_movements.csv', mode='a', newline='') as file:
-            writer = csv.writer(file)
-            writer.writerow(
-                [player["name"], player["player_num"], player["position"], slot["name"], slot["group"], slot["color"],slot["price"]])
+            start = perf_counter_ns()
+            index = self.engine.move_player(dice_value)
+            moved = perf_counter_ns()
+            self.log_movement(index)
+            logged = perf_counter_ns()
+            self.draw_move(index)
+            drawn = perf_counter_ns()
+            self.profiler.record("move", start, moved)
+            self.profiler.record("log", moved, logged)
+            self.profiler.record("draw", logged, drawn)
+        if self.pending_buy is not None:
+            # Play the rollouts in the AI's pool and poll them, so the window stays responsive.
+            player, position = self.pending_buy
+            self.pending_buy = None
+            decision = self.ai.start(self.engine, player, position)
+            self.animation_job = self.root.after(20, self.poll_ai_buy, decision, player, position)
+            return
+        self.next_turn()
+
+    def poll_ai_buy(self, decision, player, position):
+        buy = decision.poll()
+        if buy is None:
+            self.animation_job = self.root.after(20, self.poll_ai_buy, decision, player, position)
+            return
+        self.animation_job = None
+        if buy and self.economy.buy(player, position):
+            self.draw_owner(position)
+            self.show_cash()
+        self.next_turn()
+
+    def next_turn(self):
+        if self.current_player_index in self.ai_players:
+            self.queued_rolls = 0  # Clicks are for human players; computers roll by themselves.
+            self.schedule_ai_turn()
+        elif self.queued_rolls:
+            self.queued_rolls -= 1
+            self.roll_dice()
+
+    def draw_move(self, index):
+        self.count_landing(self.players.positions[index])
+        self.draw_token(index)
+        if self.engine.last_event == BOUGHT:
+            self.draw_owner(self.players.positions[index])
+        elif self.engine.last_event == BANKRUPT:
+            for position in range(self.board_size):
+                self.draw_owner(position)  # The bankrupt player's slots all changed hands.
+            self.board_canvas.itemconfig(self.tokens[index], state="hidden")
+        self.show_cash()
+
+    def count_landing(self, position):
+        count = self.landing_counts[position] = self.landing_counts[position] + 1
+        if not self.show_heat:
+            return
+        if count > self.heat_scale:
+            self.rescale_heat()  # Doubling the scale recolours every slot, but only log2(moves) times.
+        else:
+            self.board_canvas.itemconfig(f"heat{position}", fill=heat_color(count, self.heat_scale))
+
+    def rescale_heat(self):
+        while self.heat_scale < max(self.landing_counts):
+            self.heat_scale *= 2
+        for position, count in enumerate(self.landing_counts):
+            self.board_canvas.itemconfig(f"heat{position}", fill=heat_color(count, self.heat_scale))
+
+    def toggle_heat(self):
+        self.show_heat = not self.show_heat
+        if self.show_heat:
+            self.rescale_heat()  # Counts kept changing while it was hidden.
+        self.board_canvas.itemconfig("heat", state="normal" if self.show_heat else "hidden")
+
+    def show_profile(self):
+        self.profile_label.config(text=self.profiler.text())
+        self.root.after(1000, self.show_profile)
+
+    def schedule_ai_turn(self):
+        # Computer players roll by themselves, one frame after the previous move ends.
+        if self.current_player_index in self.ai_players and self.economy.active_players > 1:
+            self.animation_job = self.root.after(self.frame_ms, self.play_ai_turn)
+
+    def play_ai_turn(self):
+        self.animation_job = None
+        self.roll_dice()
+
+    def ask_to_buy(self, economy, player, position):
+        price = economy.prices[position]
+        if economy.cash[player] < price:
+            return False
+        if player in self.ai_players:
+            self.pending_buy = (player, position)  # Decided by finish_move once the move is drawn.
+            return False
+        from tkinter import messagebox
+
+        name = self.players.names[player]
+        return messagebox.askyesno("Buy", f"{name}, buy {self.board[position]['name'].strip()} for Rs {price}?")
+
+    def show_cash(self):
+        self.cash_label.config(text="   ".join(
+            f"{name}: {'bankrupt' if self.economy.bankrupt[i] else 'Rs ' + str(self.economy.cash[i])}"
+            for i, name in enumerate(self.players.names)))
+
+    def save_game(self, path="monopoly_save.bin"):
+        if self.animation_job is not None:
+            self.root.bell()  # Only save between moves.
+            return
+        write_snapshot(self.engine, path)
+
+    def load_game(self, path="monopoly_save.bin"):
+        if self.animation_job is not None:
+            self.root.bell()
+            return
+        try:
+            with open(path, mode="rb") as file:
+                restore_into(self.engine, file.read())
+        except (OSError, ValueError) as error:
+            from tkinter import messagebox
+
+            messagebox.showerror("Load Game", str(error))
+            return
+        for i in range(len(self.players)):
+            self.draw_token(i)
+            self.board_canvas.itemconfig(self.tokens[i], state="hidden" if self.economy.bankrupt[i] else "normal")
+        for position in range(self.board_size):
+            self.draw_owner(position)
+        self.show_cash()
+        self.schedule_ai_turn()
+
+    def log_movement(self, i):
+        players = self.players
+        position = players.positions[i]
+        slot = self.board[position]  # Get the slot where the player landed.
+        self.logger.log(
+            [players.names[i], players.player_nums[i], position, slot["name"], slot["group"], slot["color"], slot["price"]])
+
+    def flush_log(self):
+        # Write buffered moves even while nobody is rolling, so readers of the log are never far behind.
+        self.logger.flush()
+        self.root.after(1000, self.flush_log)
+
+    def close(self):
+        if self.animation_job is not None:
+            self.root.after_cancel(self.animation_job)
+        self.logger.close()
+        if self.ai is not None:
+            self.ai.close()
+        self.root.destroy()
 
     def draw_board(self):
+        # Draw the static board layer once; moves only update the tokens (see draw_token).
         self.board_canvas.delete("all")
         self.board_canvas.config(bg="darkseagreen1")  # Set the background color of the canvas
-        slot_size = 55  # Define the size of each slot on the board.
-        board_size = 11  # Define the size of the board grid (11x11).
+        slot_size = self.slot_size
 
         # Loop through each slot and draw it on the canvas.
         for i, slot in enumerate(self.board):
-            if i < 10:
-                # Bottom row
-                Row_1, Column_1 = (9 - i) * slot_size, 10 * slot_size
-            elif i < 20:
-                # Left column
-                Row_1, Column_1 = 0, (19 - i) * slot_size
-            elif i < 30:
-                # Top row
-                Row_1, Column_1 = (i - 20) * slot_size, 0
-            elif i < 41:
-                # Right column
-                Row_1, Column_1 = 10 * slot_size, (i - 30) * slot_size
-
+            Row_1, Column_1 = self.slot_corners[i]  # Top-left corner of the slot.
             Row_2, Column_2 = Row_1 + slot_size, Column_1 + slot_size  # Define the opposite corner of the slot.
             color = slot["color"]  # Get the slot color.
             # Draw the slot rectangle on the canvas.
-            self.board_canvas.create_rectangle(Row_1, Column_1, Row_2, Column_2, fill=color, outline="black")
+            self.board_canvas.create_rectangle(Row_1, Column_1, Row_2, Column_2, fill=color, outline="black",
+                                               tags=("board", f"slot{i}"))
+            # Heatmap overlay, inside the owner outline and under the labels and tokens.
+            self.board_canvas.create_rectangle(Row_1 + 3, Column_1 + 3, Row_2 - 3, Column_2 - 3, outline="",
+                                               stipple="gray50", state="normal" if self.show_heat else "hidden",
+                                               fill=heat_color(self.landing_counts[i], self.heat_scale),
+                                               tags=("board", "heat", f"heat{i}"))
+            if slot_size < 40:
+                continue  # Too small for the labels on big boards; the colours are still drawn.
             # Draw the slot name text.
             self.board_canvas.create_text(Row_1 + slot_size / 3, Column_1 + slot_size / 3 - 10, text=slot["name"],
-                                          fill="black")
+                                          fill="black", tags="board")
             # Draw the slot price text.
             self.board_canvas.create_text(Row_1 + slot_size / 2, Column_1 + slot_size / 2 + 10, text=slot["price"],
-                                          fill="black")
+                                          fill="black", tags="board")
             # Draw the slot group text
             self.board_canvas.create_text(Row_1 + slot_size / 4, Column_1 + slot_size / 4 + 10, text=slot["group"],
-                                          fill="black")
-
-        # Loop through each player and draw their position on the board.
-        player_colors = ["darkred", "black", "navy", "violet", "gray", "purple", "teal", "aqua"]  # Define a list of player colors
-        for i, player in enumerate(self.players):
-            pos = player["position"]  # Get the player's position.
-            if pos < 10:
-                # Bottom row
-                Row_1, Column_1 = (9 - pos) * slot_size, 10 * slot_size
-            elif pos < 20:
-                # Left column
-                Row_1, Column_1 = 0, (19 - pos) * slot_size
-            elif pos < 30:
-                # Top row
-                Row_1, Column_1 = (pos - 20) * slot_size, 0
-            elif pos < 41:
-                # Right column
-                Row_1, Column_1 = 10 * slot_size, (pos - 30) * slot_size
-
-            # Draw the player's position as a colored circle on the board. (token)
+                                          fill="black", tags="board")
+
+        # Create one token per player; later moves only change its coordinates.
+        player_colors = self.player_colors
+        self.tokens = []
+        for i in range(len(self.players)):
             player_color = player_colors[i % len(player_colors)]  # Assign a color to each player
-            self.board_canvas.create_oval(Row_1 + 10, Column_1 + 10, Row_1 + 30, Column_1 + 30, fill=player_color)
+            self.tokens.append(self.board_canvas.create_oval(0, 0, 0, 0, fill=player_color, tags=("token", f"token{i}")))
+            self.draw_token(i)
+
+    def draw_owner(self, position):
+        # Outline owned slots in their owner's colour.
+        owner = self.economy.owner[position]
+        if owner < 0:
+            self.board_canvas.itemconfig(f"slot{position}", outline="black", width=1)
+        else:
+            color = self.player_colors[owner % len(self.player_colors)]
+            self.board_canvas.itemconfig(f"slot{position}", outline=color, width=3)
+
+    def draw_token(self, i):
+        self.place_token(i, self.players.positions[i])
+
+    def place_token(self, i, position):
+        Row_1, Column_1 = self.slot_corners[position]  # Corner of the slot.
+
+        inset, far = self.token_box
+
+        # Move the player's token (a coloured circle) onto its slot.
+        self.board_canvas.coords(self.tokens[i], Row_1 + inset, Column_1 + inset, Row_1 + far, Column_1 + far)
+
+def play_headless(board, n_players=4, turns=1000, seed=None, economy=True, checkpoint=None,
+                  checkpoint_every=1_000_000):
+    # The same game without a window: everyone buys what they can afford. With a checkpoint
+    # path the game is saved there as it goes, and a killed run picks up from it when run again.
+    def new_engine():
+        players = PlayerStore.numbered(n_players)
+        return MonopolyEngine(players, board, seed=seed, economy=Economy(board, players) if economy else None)
+
+    if checkpoint is None:
+        engine = new_engine()
+        engine.run(turns)
+        return engine
+    engine = resume_or_start(checkpoint, board, new_engine)
+    if len(engine.players) != n_players or (engine.economy is not None) != economy:
+        raise ValueError(f"{checkpoint} is a checkpoint of a different game")
+    return run_checkpointed(engine, turns, checkpoint, checkpoint_every)
+
+
+def write_results(engine, output_format, file):
+    players, board = engine.players, engine.board
+    economy = engine.economy
+    standings = [
+        {"name": players.names[i], "position": players.positions[i], "slot": board[players.positions[i]]["name"].strip(),
+         "cash": economy.cash[i] if economy else None, "bankrupt": bool(economy.bankrupt[i]) if economy else False}
+        for i in range(len(players))
+    ]
+    if output_format == "json":
+        json.dump({"turns": engine.turns, "players": standings, "landings": list(engine.landings)}, file, indent=2)
+        file.write("\n")
+    elif output_format == "csv":
+        # One row per slot, like the per-slot summaries of analytics.py.
+        writer = csv.writer(file)
+        writer.writerow(["position", "name", "group", "landings"])
+        for position, (slot, count) in enumerate(zip(board, engine.landings)):
+            writer.writerow([position, slot["name"].strip(), slot["group"].strip(), count])
+    else:
+        print(f"{engine.turns} turns", file=file)
+        for player in standings:
+            cash = "" if player["cash"] is None else "bankrupt" if player["bankrupt"] else f"Rs {player['cash']}"
+            print(f"{player['name']:<12} {player['slot']:<12} {cash}", file=file)
+        print(file=file)
+        for slot, frequency in zip(board, engine.landing_frequencies()):
+            print(f"{slot['name'].strip():<12} {slot['group'].strip():<10} {frequency:.4f}", file=file)
+
+
+def play_gui(board):
+    import tkinter as tk
+    from tkinter import messagebox, simpledialog
 
-def main():
     root = tk.Tk()
-    board = mauritian_slots
-    players = []
+    names = []
+    ai_players = []
 
     num_players = simpledialog.askinteger("Input", "Enter number of players (2-8):", minvalue=2, maxvalue=8)
 
     # Loop through the number of players and get their names.
     for i in range(num_players):
         name = simpledialog.askstring("Input", f"Enter name for Player {i + 1}:")
-        players.append({"name": name, "player_num": i + 1, "position": 0})
+        names.append(name)
+        if messagebox.askyesno("Input", f"Should {name} be a computer player?"):
+            ai_players.append(i)
 
-    game = MonopolyGame(root, players, board)
+    # MONOPOLY_PROFILE=<file> times every turn and writes the histograms to <file> on exit.
+    profile_path = os.environ.get("MONOPOLY_PROFILE")
+    profiler = TurnProfiler(profile_path) if profile_path else None
+    game = MonopolyGame(root, PlayerStore(names), board, ai_players=ai_players, profiler=profiler)
     root.mainloop()
 
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play Monopoly in a Tk window, or simulate it with --headless.")
+    parser.add_argument("board", nargs="?", help="JSON or CSV board to play on (default: the Mauritian board)")
+    parser.add_argument("--headless", action="store_true", help="play without a window and print the results")
+    parser.add_argument("--players", type=int, default=4, help="2 to 8 players")
+    parser.add_argument("--turns", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--format", choices=("text", "json", "csv"), default="text")
+    parser.add_argument("--no-economy", action="store_true", help="only move the tokens (no cash or property)")
+    parser.add_argument("--checkpoint", help="with --headless: save the game here as it goes and resume from it")
+    parser.add_argument("--checkpoint-every", type=int, default=1_000_000, help="turns between checkpoints")
+    args = parser.parse_args(argv)
+    if not 2 <= args.players <= 8:
+        parser.error(f"--players must be between 2 and 8, got {args.players}")  # One token colour each.
+    if args.turns < 0:
+        parser.error(f"--turns must not be negative, got {args.turns}")
+    if args.checkpoint_every < 1:
+        parser.error(f"--checkpoint-every must be at least 1, got {args.checkpoint_every}")
+    try:
+        board = load_board(args.board) if args.board else mauritian_slots
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+
+    if args.headless:
+        try:
+            engine = play_headless(board, args.players, args.turns, args.seed, not args.no_economy, args.checkpoint,
+                                   args.checkpoint_every)
+        except (OSError, ValueError) as error:
+            parser.error(str(error))  # An unreadable checkpoint, or one from another board.
+        write_results(engine, args.format, sys.stdout)
+    else:
+        play_gui(board)
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
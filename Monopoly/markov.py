@@ -0,0 +1,89 @@
+import numpy as np
+
+from board import mauritian_slots
+
+
+def transition_matrix(board_size, step):
+    # One move of a d6 from every slot; step is +1 for clockwise and -1 for anti-clockwise.
+    matrix = np.zeros((board_size, board_size))
+    rows = np.arange(board_size)
+    for dice_value in range(1, 7):
+        matrix[rows, (rows + step * dice_value) % board_size] += 1 / 6
+    return matrix
+
+
+def stationary_distribution(matrix):
+    # Solve pi P = pi with sum(pi) = 1 by replacing one balance equation with the sum.
+    size = len(matrix)
+    system = matrix.T - np.eye(size)
+    system[-1] = 1.0
+    rhs = np.zeros(size)
+    rhs[-1] = 1.0
+    return np.linalg.solve(system, rhs)
+
+
+def n_step_distribution(matrix, steps, start=0):
+    # Where a token that starts on `start` is after `steps` moves.
+    distribution = np.zeros(len(matrix))
+    distribution[start] = 1.0
+    return distribution @ np.linalg.matrix_power(matrix, steps)
+
+
+class LandingSolver:
+    def __init__(self, board=mauritian_slots, n_players=2):
+        self.board = board  # The game board.
+        self.board_size = len(board)  # Total number of slots on the board.
+        # Player numbers start at 1: even numbers move clockwise, odd numbers anti-clockwise.
+        self.steps = [1 if player_num % 2 == 0 else -1 for player_num in range(1, n_players + 1)]
+        self.matrices = {step: transition_matrix(self.board_size, step) for step in set(self.steps)}
+
+    def stationary(self):
+        # Every player moves equally often, so the long-run landing share of the board
+        # is the average of each player's stationary distribution.
+        solved = {step: stationary_distribution(matrix) for step, matrix in self.matrices.items()}
+        return np.mean([solved[step] for step in self.steps], axis=0)
+
+    def after_moves(self, moves, start=0):
+        # Position distribution once every player has made `moves` moves.
+        solved = {step: n_step_distribution(matrix, moves, start) for step, matrix in self.matrices.items()}
+        return np.mean([solved[step] for step in self.steps], axis=0)
+
+    def landing_frequencies(self, moves, start=0):
+        # Expected share of landings per slot over each player's first `moves` moves.
+        total = np.zeros(self.board_size)
+        for step, matrix in self.matrices.items():
+            distribution = np.zeros(self.board_size)
+            distribution[start] = 1.0
+            visits = np.zeros(self.board_size)
+            for _ in range(moves):
+                distribution = distribution @ matrix
+                visits += distribution
+            total += visits * self.steps.count(step)
+        return total / total.sum()
+
+    def by_slot(self, distribution):
+        return [(slot["name"].strip(), probability) for slot, probability in zip(self.board, distribution)]
+
+    def by_group(self, distribution):
+        return self._sum_by("group", distribution)
+
+    def by_color(self, distribution):
+        return self._sum_by("color", distribution)
+
+    def _sum_by(self, key, distribution):
+        totals = {}
+        for slot, probability in zip(self.board, distribution):
+            label = slot[key].strip()
+            totals[label] = totals.get(label, 0.0) + probability
+        return totals
+
+
+if __name__ == "__main__":
+    solver = LandingSolver(n_players=4)
+    first_moves = solver.landing_frequencies(20)
+    print("Slot         long run   first 20 moves")
+    for (name, stationary), (_, early) in zip(solver.by_slot(solver.stationary()), solver.by_slot(first_moves)):
+        print(f"{name:<12} {stationary:.4f}     {early:.4f}")
+    print()
+    for group, probability in solver.by_group(first_moves).items():
+        print(f"{group:<12} {probability:.4f}")
@@ -0,0 +1,201 @@
+import atexit
+import csv
+import gzip
+import lzma
+import os
+import queue
+import re
+import shutil
+import threading
+import time
+
+COMPRESSORS = {"gzip": (".gz", gzip.open), "lzma": (".xz", lzma.open)}
+OPENERS = {".gz": gzip.open, ".xz": lzma.open}
+
+
+def closed_segments(path):
+    # (number, path) of every closed segment of a rotated log, oldest first.
+    # player_movements.csv rotates to player_movements.00001.csv(.gz|.xz), ...
+    directory = os.path.dirname(path)
+    base, ext = os.path.splitext(os.path.basename(path))
+    pattern = re.compile(re.escape(base) + r"\.(\d+)" + re.escape(ext) + r"(\.gz|\.xz)?$")
+    segments = {}
+    for name in os.listdir(directory or "."):
+        match = pattern.match(name)
+        if match:
+            # A segment caught between compression and removal exists twice: read the
+            # compressed copy, which is complete and is the one that stays.
+            number = int(match.group(1))
+            if match.group(2) or number not in segments:
+                segments[number] = os.path.join(directory, name)
+    return sorted(segments.items())
+
+
+def segment_paths(path):
+    # Closed segments, oldest first, followed by the live file.
+    paths = [segment for _, segment in closed_segments(path)]
+    if os.path.exists(path):
+        paths.append(path)
+    return paths
+
+
+def open_segment(path):
+    opener = OPENERS.get(os.path.splitext(path)[1], open)
+    return opener(path, mode="rt", newline="")
+
+
+def iter_rows(path):
+    # Every row of a rotated log, across compressed and uncompressed segments.
+    for segment in segment_paths(path):
+        with open_segment(segment) as file:
+            yield from csv.reader(file)
+
+
+class MovementLogger:
+    # Keeps player_movements.csv open and writes rows in batches instead of
+    # opening the file for every move. Rows are written once `buffer_size` rows
+    # are waiting or `flush_interval` seconds have passed since the last write,
+    # and whatever is left is flushed by close(), which also runs at exit. In
+    # background mode the writer thread also flushes rows left waiting for
+    # flush_interval when no new moves come in; otherwise call flush() from the
+    # caller's own timer (MonopolyGame does it with root.after).
+    # With max_bytes set the live file is rotated into numbered segments once it
+    # reaches that size (rotate() also starts a new one, e.g. for each game); closed
+    # segments are compressed and the oldest beyond max_segments deleted on a
+    # separate thread, so neither the game nor the writer waits on them.
+    def __init__(self, path="player_movements.csv", buffer_size=256, flush_interval=1.0, background=False,
+                 max_bytes=None, compression=None, max_segments=None, new_segment=False):
+        if compression is not None and compression not in COMPRESSORS:
+            raise ValueError(f"unknown compression {compression!r}, expected one of {sorted(COMPRESSORS)}")
+        self.path = path
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes  # Rotate once the live file is this big, or never if None.
+        self.compression = compression  # "gzip", "lzma" or None for closed segments.
+        self.max_segments = max_segments  # Closed segments kept, or all if None.
+        self.buffer = []
+        self.lock = threading.Lock()  # Guards buffer, which the writer thread may take on a timeout.
+        self.file = open(path, mode="a", newline="")
+        self.writer = csv.writer(self.file)
+        self.last_flush = time.monotonic()
+        self.closed = False
+
+        # Optional writer thread so the caller never waits on the disk.
+        self.queue = None
+        self.thread = None
+        if background:
+            self.queue = queue.Queue()
+            self.thread = threading.Thread(target=self._write_loop, name="movement-logger", daemon=True)
+            self.thread.start()
+
+        # Closed segments are compressed and pruned here.
+        self.segments = queue.Queue()
+        self.segment_thread = threading.Thread(target=self._segment_loop, name="movement-segments", daemon=True)
+        self.segment_thread.start()
+
+        atexit.register(self.close)
+        if new_segment:
+            self.rotate()
+
+    def log(self, row):
+        if self.closed:
+            raise ValueError("log() on a closed MovementLogger")
+        with self.lock:
+            self.buffer.append(row)
+            due = len(self.buffer) >= self.buffer_size or time.monotonic() - self.last_flush >= self.flush_interval
+        if due:
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            rows, self.buffer = self.buffer, []
+            self.last_flush = time.monotonic()
+        if not rows:
+            return
+        if self.queue is not None:
+            self.queue.put(rows)  # The writer thread owns the file from here.
+        else:
+            self._write(rows)
+
+    def rotate(self):
+        # Close the live file as a segment and start an empty one (a no-op if it is empty).
+        self.flush()
+        if self.queue is not None:
+            self.queue.put("rotate")
+        else:
+            self._rotate()
+
+    def close(self):
+        if self.closed:
+            return
+        self.flush()
+        self.closed = True
+        if self.thread is not None:
+            self.queue.put(None)  # Tell the writer thread to stop once the queue is drained.
+            self.thread.join()
+        self.file.close()
+        self.segments.put(None)  # Finish compressing the segments already closed.
+        self.segment_thread.join()
+        atexit.unregister(self.close)
+
+    def _write(self, rows):
+        self.writer.writerows(rows)
+        self.file.flush()
+        if self.max_bytes is not None and self.file.tell() >= self.max_bytes:
+            self._rotate()
+
+    def _rotate(self):
+        if self.file.tell() == 0:
+            return
+        self.file.close()
+        segments = closed_segments(self.path)
+        number = segments[-1][0] + 1 if segments else 1
+        base, ext = os.path.splitext(self.path)
+        segment = f"{base}.{number:05d}{ext}"
+        os.replace(self.path, segment)
+        self.file = open(self.path, mode="a", newline="")
+        self.writer = csv.writer(self.file)
+        self.segments.put(segment)
+
+    def _write_loop(self):
+        while True:
+            try:
+                rows = self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                # No moves for a while: write whatever log() is still holding.
+                with self.lock:
+                    rows, self.buffer = self.buffer, []
+                    self.last_flush = time.monotonic()
+                if rows:
+                    self._write(rows)
+                continue
+            if rows is None:
+                break
+            if rows == "rotate":
+                self._rotate()
+            else:
+                self._write(rows)
+
+    def _segment_loop(self):
+        while True:
+            segment = self.segments.get()
+            if segment is None:
+                break
+            if not os.path.exists(segment):
+                continue  # Already pruned while it waited.
+            if self.compression is not None:
+                suffix, opener = COMPRESSORS[self.compression]
+                with open(segment, mode="rb") as source, opener(segment + suffix + ".tmp", mode="wb") as target:
+                    shutil.copyfileobj(source, target)
+                os.replace(segment + suffix + ".tmp", segment + suffix)  # Only complete files get the real name.
+                os.remove(segment)
+            if self.max_segments is not None:
+                segments = closed_segments(self.path)
+                for _, old in segments[:max(len(segments) - self.max_segments, 0)]:
+                    os.remove(old)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
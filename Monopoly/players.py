@@ -0,0 +1,25 @@
+from array import array
+
+
+class PlayerStore:
+    # All players as parallel typed arrays (one entry per player) instead of one dict
+    # per player. The direction each player moves in is worked out once here:
+    # even player numbers go clockwise (+1), odd player numbers anti-clockwise (-1).
+    __slots__ = ("names", "player_nums", "positions", "steps", "cash", "bankrupt")
+
+    def __init__(self, names, player_nums=None):
+        if player_nums is None:
+            player_nums = range(1, len(names) + 1)  # Player numbers start at 1, as in main().
+        self.names = list(names)
+        self.player_nums = array("I", player_nums)
+        self.positions = array("i", [0] * len(self.names))
+        self.steps = array("b", (1 if num % 2 == 0 else -1 for num in self.player_nums))
+        self.cash = array("q", [0] * len(self.names))
+        self.bankrupt = array("B", [0] * len(self.names))
+
+    @classmethod
+    def numbered(cls, count):
+        return cls([f"Player {i + 1}" for i in range(count)])
+
+    def __len__(self):
+        return len(self.names)
@@ -0,0 +1,72 @@
+import atexit
+import json
+
+
+class Histogram:
+    # Durations in nanoseconds, bucketed by powers of two: bucket k holds values below 2**k.
+    __slots__ = ("buckets", "count", "total", "largest")
+
+    def __init__(self):
+        self.buckets = [0] * 64
+        self.count = 0
+        self.total = 0
+        self.largest = 0
+
+    def add(self, ns):
+        self.buckets[ns.bit_length()] += 1
+        self.count += 1
+        self.total += ns
+        if ns > self.largest:
+            self.largest = ns
+
+    def percentile(self, fraction):
+        # Upper edge of the bucket the percentile falls in.
+        target = fraction * self.count
+        seen = 0
+        for k, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= target:
+                return min(1 << k, self.largest)
+        return 0
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "mean_us": self.total / self.count / 1e3 if self.count else 0.0,
+            "p50_us": self.percentile(0.5) / 1e3,
+            "p99_us": self.percentile(0.99) / 1e3,
+            "max_us": self.largest / 1e3,
+        }
+
+
+class TurnProfiler:
+    # Collects per-phase timings of a turn (dice, move, log, draw). MonopolyGame only
+    # calls into it when one is attached, so leaving it off costs a single branch.
+    def __init__(self, dump_path=None):
+        self.phases = {}
+        self.dump_path = dump_path  # Where the histograms are written at exit, if anywhere.
+        if dump_path is not None:
+            atexit.register(self.dump)
+
+    def record(self, phase, start_ns, end_ns):
+        histogram = self.phases.get(phase)
+        if histogram is None:
+            histogram = self.phases[phase] = Histogram()
+        histogram.add(end_ns - start_ns)
+
+    def summary(self):
+        return {phase: histogram.summary() for phase, histogram in self.phases.items()}
+
+    def text(self):
+        lines = []
+        for phase, stats in self.summary().items():
+            lines.append(f"{phase:<5} n={stats['count']:<6} mean={stats['mean_us']:8.1f}us "
+                         f"p50<={stats['p50_us']:8.1f}us p99<={stats['p99_us']:8.1f}us max={stats['max_us']:8.1f}us")
+        return "\n".join(lines)
+
+    def dump(self, path=None):
+        path = path or self.dump_path
+        data = {phase: {"buckets": histogram.buckets, **histogram.summary()}
+                for phase, histogram in self.phases.items()}
+        with open(path, mode="w") as file:
+            json.dump(data, file, indent=2)
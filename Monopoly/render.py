@@ -0,0 +1,176 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+
+from analytics import heat_color
+from board import load_board, mauritian_slots
+from economy import Economy
+from engine import MonopolyEngine
+from layout import board_extent, fit_slot_size, perimeter_layout, token_box
+from players import PlayerStore
+
+PLAYER_COLORS = ["darkred", "black", "navy", "violet", "gray", "purple", "teal", "aqua"]  # As in MonopolyGame.
+# Tk (X11) colour names used by the boards that Pillow does not know.
+TK_COLORS = {
+    "palegreen1": (154, 255, 154),
+    "palegreen3": (124, 205, 124),
+    "springgreen4": (0, 139, 69),
+    "darkseagreen1": (193, 255, 193),
+}
+
+
+def tk_color(name):
+    rgb = TK_COLORS.get(name)
+    if rgb is not None:
+        return rgb
+    for candidate in (name.replace(" ", ""), name.replace(" ", "").rstrip("0123456789")):  # "light blue", "khaki3"
+        try:
+            return ImageColor.getrgb(candidate)
+        except ValueError:
+            pass
+    return (255, 255, 255)
+
+
+class BoardRenderer:
+    # Draws board states as PIL images on the same layout as MonopolyGame.draw_board, with
+    # no Tk and no display. The slots and labels are drawn once; every frame copies that
+    # layer and adds the owner outlines and the tokens.
+    def __init__(self, board=mauritian_slots, slot_size=None):
+        self.board = board
+        self.slot_size = slot_size or fit_slot_size(len(board))
+        self.corners = perimeter_layout(len(board), self.slot_size)
+        self.token_box = token_box(self.slot_size)
+        self.extent = board_extent(len(board), self.slot_size)
+        self.font = ImageFont.load_default()
+        self.background = self.draw_slots([tk_color(slot["color"]) for slot in board])
+
+        # Fixed palette for render_indexed: every flat colour exactly, plus the text's
+        # anti-aliasing shades from the static layer.
+        exact = list(dict.fromkeys([tk_color("darkseagreen1"), (0, 0, 0)] + [tk_color(slot["color"]) for slot in board]
+                                   + [tk_color(color) for color in PLAYER_COLORS]))[:256]
+        shades = self.background.quantize(256 - len(exact)).getpalette() if len(exact) < 256 else []
+        self.palette = Image.new("P", (1, 1))
+        self.palette.putpalette([value for rgb in exact for value in rgb] + shades[:3 * (256 - len(exact))])
+
+    def draw_slots(self, fills):
+        image = Image.new("RGB", (self.extent, self.extent), tk_color("darkseagreen1"))
+        draw = ImageDraw.Draw(image)
+        slot_size = self.slot_size
+        for (Row_1, Column_1), slot, fill in zip(self.corners, self.board, fills):
+            draw.rectangle((Row_1, Column_1, Row_1 + slot_size, Column_1 + slot_size), fill=fill, outline="black")
+            if slot_size < 40:
+                continue
+            # Name, price and group where draw_board puts them.
+            self.text(draw, Row_1 + slot_size / 3, Column_1 + slot_size / 3 - 10, slot["name"])
+            self.text(draw, Row_1 + slot_size / 2, Column_1 + slot_size / 2 + 10, slot["price"])
+            self.text(draw, Row_1 + slot_size / 4, Column_1 + slot_size / 4 + 10, slot["group"])
+        return image
+
+    def text(self, draw, x, y, text):
+        # Centred on (x, y) like a Tk text item.
+        left, top, right, bottom = draw.textbbox((0, 0), text, font=self.font)
+        draw.text((x - (right - left) / 2, y - (bottom - top) / 2), text, fill="black", font=self.font)
+
+    def render(self, positions, owner=None, bankrupt=None, counts=None):
+        # One frame: token positions, optionally owner per slot (-1 for none), bankrupt
+        # flags per player and landing counts to shade the slots with instead of their colours.
+        if counts is None:
+            image = self.background.copy()
+        else:
+            highest = max(counts)
+            image = self.draw_slots([heat_color(count, highest) for count in counts])
+        draw = ImageDraw.Draw(image)
+        slot_size = self.slot_size
+        if owner is not None:
+            for position, player in enumerate(owner):
+                if player >= 0:
+                    Row_1, Column_1 = self.corners[position]
+                    draw.rectangle((Row_1, Column_1, Row_1 + slot_size, Column_1 + slot_size),
+                                   outline=PLAYER_COLORS[player % len(PLAYER_COLORS)], width=3)
+        inset, far = self.token_box
+        for i, position in enumerate(positions):
+            if bankrupt is not None and bankrupt[i]:
+                continue
+            Row_1, Column_1 = self.corners[position]
+            draw.ellipse((Row_1 + inset, Column_1 + inset, Row_1 + far, Column_1 + far),
+                         fill=PLAYER_COLORS[i % len(PLAYER_COLORS)])
+        return image
+
+    def render_indexed(self, positions, owner=None, bankrupt=None):
+        # The same frame mapped onto the board's palette, which PNG-encodes several times
+        # faster (and smaller) than full colour.
+        return self.render(positions, owner, bankrupt).quantize(palette=self.palette, dither=Image.Dither.NONE)
+
+    def render_engine(self, engine):
+        if engine.economy is None:
+            return self.render(engine.players.positions)
+        return self.render(engine.players.positions, engine.economy.owner, engine.economy.bankrupt)
+
+
+def game_states(board=mauritian_slots, n_players=4, turns=1000, seed=None):
+    # (positions, owner, bankrupt) before the first turn and after every turn of a
+    # simulated game in which everyone buys what they can afford.
+    players = PlayerStore.numbered(n_players)
+    economy = Economy(board, players)
+    engine = MonopolyEngine(players, board, seed=seed, economy=economy)
+    yield players.positions.tolist(), economy.owner.tolist(), economy.bankrupt.tolist()
+    for _ in range(turns):
+        if economy.active_players < 2:
+            break
+        engine.play_turn()
+        yield players.positions.tolist(), economy.owner.tolist(), economy.bankrupt.tolist()
+
+
+renderer = None  # One per worker process, so the static layer is drawn once per worker.
+
+
+def start_worker(board, slot_size):
+    global renderer
+    renderer = BoardRenderer(board, slot_size)
+
+
+def export_chunk(directory, first, states):
+    for n, state in enumerate(states, first):
+        renderer.render_indexed(*state).save(os.path.join(directory, f"frame{n:06d}.png"))
+    return len(states)
+
+
+def export_frames(states, directory, board=mauritian_slots, slot_size=None, workers=None, chunk_frames=64):
+    # Writes frame000000.png, frame000001.png, ... one per (positions, owner, bankrupt)
+    # state, rendered across a process pool. Returns the number of frames written.
+    os.makedirs(directory, exist_ok=True)
+    states = iter(states)
+    with ProcessPoolExecutor(max_workers=workers, initializer=start_worker, initargs=(board, slot_size)) as pool:
+        tasks = []
+        first = 0
+        while True:
+            chunk = list(islice(states, chunk_frames))
+            if not chunk:
+                break
+            tasks.append(pool.submit(export_chunk, directory, first, chunk))
+            first += len(chunk)
+        return sum(task.result() for task in tasks)
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Render a simulated game to PNG frames without a display.")
+    parser.add_argument("directory", nargs="?", default="frames")
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--turns", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--board", help="JSON or CSV board to play on (default: the Mauritian board)")
+    parser.add_argument("--slot-size", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    board = load_board(args.board) if args.board else mauritian_slots
+
+    start = time.perf_counter()
+    frames = export_frames(game_states(board, args.players, args.turns, args.seed), args.directory, board,
+                           args.slot_size, args.workers)
+    elapsed = time.perf_counter() - start
+    print(f"{frames} frames in {elapsed:.2f}s ({frames / elapsed:,.0f} frames/sec) in {args.directory}")
@@ -0,0 +1,224 @@
+import json
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+
+from board import load_board, mauritian_slots
+from economy import Economy
+from engine import MonopolyEngine
+from players import PlayerStore
+from snapshot import board_id
+from tournament import game_seed
+
+# games holds one summary row per game and landings its per-slot counts. landing_totals
+# keeps the same counts summed per (board, player count, seed, turn limit, slot), updated in
+# the same transaction as every insert, so shares over millions of games read a few dozen
+# rows. The turn limit is part of the key because a rerun with more turns replays the same
+# dice and would otherwise count the shorter run's moves twice.
+# A game is stored once: rerunning a seed skips the games already there, and only the
+# games actually inserted are added to the totals.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS boards (
+    id INTEGER PRIMARY KEY,
+    checksum INTEGER NOT NULL UNIQUE,
+    size INTEGER NOT NULL,
+    board_json TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS slots (
+    board INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    slot_group TEXT NOT NULL,
+    PRIMARY KEY (board, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    board INTEGER NOT NULL,
+    seed INTEGER NOT NULL,
+    game INTEGER NOT NULL,
+    players INTEGER NOT NULL,
+    turns INTEGER NOT NULL,
+    winner INTEGER
+);
+CREATE UNIQUE INDEX IF NOT EXISTS games_key ON games (board, seed, players, turns, game);
+CREATE INDEX IF NOT EXISTS games_seed ON games (seed, game);
+CREATE INDEX IF NOT EXISTS games_board_players ON games (board, players);
+CREATE INDEX IF NOT EXISTS games_players ON games (players);
+CREATE TABLE IF NOT EXISTS landings (
+    game INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (game, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS landing_totals (
+    board INTEGER NOT NULL,
+    players INTEGER NOT NULL,
+    seed INTEGER NOT NULL,
+    turns INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (board, players, seed, turns, position)
+) WITHOUT ROWID;
+"""
+
+
+def play_game_results(seed, first_game, last_game, n_players, turns, board, economy):
+    # (game, turns played, winner or None, landings per slot) for every game of a shard,
+    # with the same per-game seeds as tournament.py.
+    results = []
+    for game in range(first_game, last_game):
+        players = PlayerStore.numbered(n_players)
+        engine = MonopolyEngine(players, board, seed=game_seed(seed, game),
+                                economy=Economy(board, players) if economy else None)
+        engine.run(turns)
+        winner = None
+        if economy:
+            winner = max(range(n_players), key=engine.economy.net_worth)
+        results.append((game, engine.turns, winner, list(engine.landings)))
+    return results
+
+
+class ResultsStore:
+    def __init__(self, path="monopoly_results.db"):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")  # Safe with WAL; commits do not wait on fsync.
+        self.connection.executescript(SCHEMA)
+        columns = [row[1] for row in self.connection.execute("PRAGMA table_info(landing_totals)")]
+        if "turns" not in columns:
+            self.connection.close()
+            raise ValueError(f"{path} was written by an older results_db.py; store the games in a new file")
+        self.boards = {}  # Board checksum -> boards.id.
+
+    def board_key(self, board):
+        checksum = board_id(board)
+        key = self.boards.get(checksum)
+        if key is not None:
+            return key
+        row = self.connection.execute("SELECT id FROM boards WHERE checksum = ?", (checksum,)).fetchone()
+        if row is None:
+            with self.connection:
+                cursor = self.connection.execute("INSERT INTO boards (checksum, size, board_json) VALUES (?, ?, ?)",
+                                                 (checksum, len(board), json.dumps(board)))
+                self.connection.executemany(
+                    "INSERT INTO slots (board, position, name, slot_group) VALUES (?, ?, ?, ?)",
+                    [(cursor.lastrowid, position, slot["name"].strip(), slot["group"].strip())
+                     for position, slot in enumerate(board)])
+            row = (cursor.lastrowid,)
+        key = self.boards[checksum] = row[0]
+        return key
+
+    def add_games(self, board, seed, n_players, max_turns, results):
+        # Stores (game, turns, winner, landings) rows of games played with a limit of
+        # max_turns turns in one transaction: a summary per game, its per-slot counts and the
+        # running totals. Games stored before are skipped; returns the number newly stored.
+        key = self.board_key(board)
+        results = list(results)
+        totals = [0] * len(board)
+        with self.connection:
+            if results:
+                stored = set(self.connection.execute(
+                    "SELECT game, turns FROM games WHERE board = ? AND seed = ? AND players = ? AND game BETWEEN ? AND ?",
+                    (key, seed, n_players, min(row[0] for row in results), max(row[0] for row in results))))
+                results = [row for row in results if (row[0], row[1]) not in stored]
+            if not results:
+                return 0
+            first_id = self.connection.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM games").fetchone()[0]
+            self.connection.executemany(
+                "INSERT INTO games (id, board, seed, game, players, turns, winner) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(first_id + i, key, seed, game, n_players, turns, winner)
+                 for i, (game, turns, winner, _) in enumerate(results)])
+            self.connection.executemany(
+                "INSERT INTO landings (game, position, count) VALUES (?, ?, ?)",
+                [(first_id + i, position, count)
+                 for i, (_, _, _, landings) in enumerate(results)
+                 for position, count in enumerate(landings) if count])
+            for _, _, _, landings in results:
+                for position, count in enumerate(landings):
+                    totals[position] += count
+            self.connection.executemany(
+                "INSERT INTO landing_totals (board, players, seed, turns, position, count) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (board, players, seed, turns, position) DO UPDATE SET count = count + excluded.count",
+                [(key, n_players, seed, max_turns, position, count) for position, count in enumerate(totals)])
+        return len(results)
+
+    def simulate(self, n_games, n_players=4, turns=100, seed=0, board=mauritian_slots, economy=False,
+                 workers=None, games_per_task=None):
+        # Plays the games across a process pool like tournament.run_tournament and stores
+        # each shard as it arrives, one transaction per shard.
+        workers = workers or os.cpu_count() or 1
+        if games_per_task is None:
+            games_per_task = max(1, min(n_games // (workers * 4), 10_000))
+        stored = 0
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            shards = [
+                pool.submit(play_game_results, seed, first, min(first + games_per_task, n_games), n_players, turns,
+                            board, economy)
+                for first in range(0, n_games, games_per_task)
+            ]
+            for shard in shards:
+                stored += self.add_games(board, seed, n_players, turns, shard.result())
+        return stored
+
+    def landing_share(self, group, board=None, n_players=None, seed=None, max_turns=None):
+        # Fraction of all landings on the slots of `group` ("Group 8", "Railroad", ...),
+        # optionally only for one board, player count, seed or turn limit. Reads
+        # landing_totals only.
+        query = ("SELECT SUM(CASE WHEN s.slot_group = ? THEN t.count ELSE 0 END), SUM(t.count) "
+                 "FROM landing_totals t JOIN slots s ON s.board = t.board AND s.position = t.position WHERE 1")
+        parameters = [group]
+        for column, value in (("board", None if board is None else self.board_key(board)),
+                              ("players", n_players), ("seed", seed), ("turns", max_turns)):
+            if value is not None:
+                query += f" AND t.{column} = ?"
+                parameters.append(value)
+        in_group, total = self.connection.execute(query, parameters).fetchone()
+        return in_group / total if total else 0.0
+
+    def game_count(self, board=None, n_players=None):
+        query, parameters = "SELECT COUNT(*) FROM games WHERE 1", []
+        if board is not None:
+            query += " AND board = ?"
+            parameters.append(self.board_key(board))
+        if n_players is not None:
+            query += " AND players = ?"
+            parameters.append(n_players)
+        return self.connection.execute(query, parameters).fetchone()[0]
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Store simulated Monopoly games in SQLite and query landing shares.")
+    parser.add_argument("--db", default="monopoly_results.db")
+    parser.add_argument("--board", help="JSON or CSV board to play on (default: the Mauritian board)")
+    parser.add_argument("--games", type=int, default=0, help="games to simulate and store first")
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--turns", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--economy", action="store_true", help="play with cash and property and record winners")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--group", default="Group 8", help="group whose landing share is printed")
+    args = parser.parse_args()
+    board = load_board(args.board) if args.board else mauritian_slots
+
+    with ResultsStore(args.db) as store:
+        if args.games:
+            start = time.perf_counter()
+            stored = store.simulate(args.games, args.players, args.turns, args.seed, board, args.economy, args.workers)
+            print(f"Stored {stored} games in {time.perf_counter() - start:.2f}s")
+        start = time.perf_counter()
+        share = store.landing_share(args.group, board)
+        elapsed = time.perf_counter() - start
+        print(f"{args.group}: {share:.4%} of landings over {store.game_count(board)} games ({elapsed * 1e3:.2f} ms)")
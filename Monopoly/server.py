@@ -0,0 +1,269 @@
+import asyncio
+import json
+import time
+from collections import deque
+
+from board import mauritian_slots
+from economy import Economy
+from engine import MonopolyEngine
+from players import PlayerStore
+
+# Line-based JSON protocol: every request and every reply is one JSON object per line.
+#   {"op": "join", "room": "r1", "name": "Alice"}  -> {"ok": true, "player": 0, "state": {...}}
+#   {"op": "roll", "buy": true}                     -> {"ok": true, "event": "moved", ...}
+#   {"op": "roll"}                                  -> {"ok": true, "event": "moved", "offer": 12, ...}
+#   {"op": "buy", "buy": true}                      -> {"ok": true, "event": "bought", ...}
+#   {"op": "state"}                                 -> {"ok": true, "state": {...}}
+#   {"op": "leave"}                                 -> {"ok": true}
+# A roll without "buy" stops at an unowned slot the player can afford and offers it
+# ("offer" is its position, else null); the game waits for their "buy" answer.
+# A room's players are fixed by its first roll; after that nobody else can join.
+# Every move is also sent to the other connections in the room.
+# A player whose connection leaves keeps the seat: joining again with the same name
+# reclaims it, and until then any other player can roll for it (without buying).
+
+MAX_PLAYERS = 8
+MAX_LINE = 4096  # Longest request line accepted.
+RECENT_MOVES = 32  # Moves kept per room for clients that (re)join.
+MAX_BUFFERED = 64 * 1024  # A client this far behind on reading is dropped.
+
+
+class Room:
+    # One game. Everything in it is bounded: at most MAX_PLAYERS players and the last
+    # RECENT_MOVES moves, whatever the number of turns played.
+    def __init__(self, name, board):
+        self.name = name
+        self.board = board
+        self.names = []  # Players who joined, in turn order.
+        self.owners = []  # Connection that controls each player, or None once it left.
+        self.members = set()  # Connections that receive this room's moves.
+        self.engine = None  # Created on the first roll, once the players are known.
+        self.buy = True  # Decision for the roll being played, read by the buy policy; None to offer.
+        self.offer = None  # (player, position) waiting for that player's "buy" answer.
+        self.recent = deque(maxlen=RECENT_MOVES)
+        self.last_active = time.monotonic()
+
+    def start(self):
+        players = PlayerStore(self.names)
+        economy = Economy(self.board, players, buy_policy=self.buy_policy)
+        self.engine = MonopolyEngine(players, self.board, economy=economy)
+
+    def buy_policy(self, economy, player, position):
+        if economy.cash[player] < economy.prices[position]:
+            return False
+        if self.buy is None:
+            self.offer = (player, position)  # Decided by a "buy" request once the move is seen.
+            return False
+        return self.buy
+
+    def state(self):
+        state = {"room": self.name, "board_size": len(self.board), "names": self.names, "started": self.engine is not None}
+        if self.engine is not None:
+            engine = self.engine
+            state.update({
+                "turns": engine.turns,
+                "current": engine.current_player_index,
+                "positions": engine.players.positions.tolist(),
+                "cash": engine.economy.cash.tolist(),
+                "bankrupt": engine.economy.bankrupt.tolist(),
+                "owner": engine.economy.owner.tolist(),
+                "mortgaged": engine.economy.mortgaged.tolist(),
+            })
+        state["recent"] = list(self.recent)
+        return state
+
+
+class MonopolyServer:
+    def __init__(self, board=mauritian_slots, max_rooms=10_000, idle_timeout=600):
+        self.board = board
+        self.max_rooms = max_rooms
+        self.idle_timeout = idle_timeout  # Seconds before an empty or quiet room is dropped.
+        self.rooms = {}
+        self.rolls = 0  # Total rolls served, for the load generator.
+
+    async def serve(self, host="127.0.0.1", port=8765):
+        server = await asyncio.start_server(self.handle, host, port, limit=MAX_LINE)
+        sweeper = asyncio.create_task(self.sweep_idle_rooms())
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            sweeper.cancel()
+
+    async def sweep_idle_rooms(self):
+        while True:
+            await asyncio.sleep(min(self.idle_timeout, 60))
+            now = time.monotonic()
+            for name, room in list(self.rooms.items()):
+                abandoned = room.owners and all(owner is None for owner in room.owners)
+                if not room.members or abandoned or now - room.last_active > self.idle_timeout:
+                    del self.rooms[name]
+
+    async def handle(self, reader, writer):
+        connection = Connection(writer)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    connection.send({"ok": False, "error": "line too long"})
+                    break
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    reply = self.dispatch(connection, request)
+                except (ValueError, KeyError, TypeError) as error:
+                    reply = {"ok": False, "error": str(error)}
+                connection.send(reply)
+                if connection.closed:
+                    break
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.leave(connection)
+            writer.close()
+
+    def dispatch(self, connection, request):
+        op = request["op"]
+        if op == "join":
+            return self.join(connection, str(request["room"]), str(request.get("name", "")))
+        if op in ("roll", "buy"):
+            buy = request.get("buy")
+            if not isinstance(buy, bool) and (op == "buy" or buy is not None):
+                return {"ok": False, "error": "buy must be true or false"}
+            if op == "buy":
+                return self.buy(connection, buy)
+            return self.roll(connection, buy)
+        if op == "state":
+            room = self.rooms.get(connection.room)
+            if room is None:
+                return {"ok": False, "error": "not in a room"}
+            return {"ok": True, "state": room.state()}
+        if op == "leave":
+            self.leave(connection)
+            return {"ok": True}
+        return {"ok": False, "error": f"unknown op {op!r}"}
+
+    def join(self, connection, name, player_name):
+        if connection.room is not None and connection.room != name:
+            return {"ok": False, "error": "already in another room"}
+        room = self.rooms.get(name)
+        if room is None:
+            if len(self.rooms) >= self.max_rooms:
+                return {"ok": False, "error": "server is full"}
+            room = self.rooms[name] = Room(name, self.board)
+        connection.room = name
+        room.members.add(connection)
+        room.last_active = time.monotonic()
+        if not player_name:
+            return {"ok": True, "player": None, "state": room.state()}  # Watch only.
+        for player, (seat, owner) in enumerate(zip(room.names, room.owners)):
+            if seat == player_name and owner is None:
+                room.owners[player] = connection  # Back after leaving: take the seat again.
+                return {"ok": True, "player": player, "state": room.state()}
+        if room.engine is not None:
+            return {"ok": False, "error": "game already started"}
+        if len(room.names) >= MAX_PLAYERS:
+            return {"ok": False, "error": "room is full"}
+        room.names.append(player_name)
+        room.owners.append(connection)
+        return {"ok": True, "player": len(room.names) - 1, "state": room.state()}
+
+    def roll(self, connection, buy):
+        room = self.rooms.get(connection.room)
+        if room is None:
+            return {"ok": False, "error": "not in a room"}
+        if room.engine is None:
+            if len(room.names) < 2:
+                return {"ok": False, "error": "need at least 2 players"}
+            room.start()
+        engine = room.engine
+        if engine.economy.active_players < 2:
+            return {"ok": False, "error": "game over"}
+        if room.offer is not None:
+            return {"ok": False, "error": f"waiting for {room.names[room.offer[0]]} to decide on buying"}
+        owner = room.owners[engine.current_player_index]
+        if owner is None and connection in room.owners:
+            buy = False  # Rolling for a player who left, so the game does not wait for them.
+        elif owner is not connection:
+            return {"ok": False, "error": "not your turn"}
+
+        room.buy = buy
+        dice_value, index = engine.play_turn()
+        self.rolls += 1
+        room.last_active = time.monotonic()
+        position = engine.players.positions[index]
+        move = {"ok": True, "event": "moved", "player": index, "dice": dice_value, "position": position,
+                "owner": engine.economy.owner[position], "cash": engine.economy.cash.tolist(),
+                "bankrupt": engine.economy.bankrupt.tolist(), "current": engine.current_player_index,
+                "turns": engine.turns, "offer": room.offer[1] if room.offer is not None else None}
+        room.recent.append([index, dice_value, position])
+        for member in room.members:
+            if member is not connection:
+                member.send(move)
+        return move
+
+    def buy(self, connection, buy):
+        room = self.rooms.get(connection.room)
+        if room is None:
+            return {"ok": False, "error": "not in a room"}
+        if room.offer is None:
+            return {"ok": False, "error": "nothing to buy"}
+        player, position = room.offer
+        if room.owners[player] is not connection:
+            return {"ok": False, "error": "not your purchase"}
+        room.offer = None
+        room.last_active = time.monotonic()
+        economy = room.engine.economy
+        if not buy or not economy.buy(player, position):
+            return {"ok": True}
+        message = {"ok": True, "event": "bought", "player": player, "position": position,
+                   "owner": economy.owner[position], "cash": economy.cash.tolist()}
+        for member in room.members:
+            if member is not connection:
+                member.send(message)
+        return message
+
+    def leave(self, connection):
+        room = self.rooms.get(connection.room)
+        if room is not None:
+            room.members.discard(connection)
+            for player, owner in enumerate(room.owners):
+                if owner is connection:
+                    room.owners[player] = None  # Free the seat; see join() and roll().
+                    if room.offer is not None and room.offer[0] == player:
+                        room.offer = None  # Nobody is left to answer it: declined.
+        connection.room = None
+
+
+class Connection:
+    def __init__(self, writer):
+        self.writer = writer
+        self.room = None
+        self.closed = False
+
+    def send(self, message):
+        if self.closed:
+            return
+        transport = self.writer.transport
+        if transport.is_closing() or transport.get_write_buffer_size() > MAX_BUFFERED:
+            self.closed = True  # Not reading its moves: drop it rather than buffer without limit.
+            transport.abort()
+            return
+        self.writer.write(json.dumps(message, separators=(",", ":")).encode() + b"\n")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Host many Monopoly games over a line-based JSON protocol.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-rooms", type=int, default=10_000)
+    args = parser.parse_args()
+    try:
+        asyncio.run(MonopolyServer(max_rooms=args.max_rooms).serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
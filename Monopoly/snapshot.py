@@ -0,0 +1,156 @@
+import json
+import os
+import struct
+import zlib
+from array import array
+
+from economy import Economy
+from engine import MonopolyEngine
+from players import PlayerStore
+
+# Layout: MAGIC, HEADER, then the players' names (length-prefixed UTF-8), the per-player
+# arrays (player numbers, positions, cash, bankrupt flags), the per-slot arrays (landings,
+# and owner and mortgaged when the economy is on) and finally the RNG state.
+MAGIC = b"MPSN"
+VERSION = 1
+HEADER = struct.Struct("<BIQHHHB")  # version, board id, turns, current player, players, slots, has economy.
+NAME = struct.Struct("<H")
+RNG = struct.Struct("<625IBd")  # MT19937 state and position, then the cached gauss value.
+
+
+def board_id(board):
+    # Identifies the board a snapshot was taken on, so it is never restored onto another one.
+    return zlib.crc32(json.dumps(board, separators=(",", ":")).encode())
+
+
+def save(engine):
+    players = engine.players
+    economy = engine.economy
+    size = engine.board_size
+    parts = [MAGIC, HEADER.pack(VERSION, board_id(engine.board), engine.turns, engine.current_player_index,
+                                len(players), size, economy is not None)]
+    for name in players.names:
+        encoded = name.encode()
+        parts.append(NAME.pack(len(encoded)))
+        parts.append(encoded)
+    parts += [players.player_nums.tobytes(), players.positions.tobytes(), players.cash.tobytes(),
+              players.bankrupt.tobytes(), array("Q", engine.landings).tobytes()]
+    if economy is not None:
+        parts += [economy.owner.tobytes(), economy.mortgaged.tobytes()]
+    _, state, gauss = engine.rng.getstate()
+    parts.append(RNG.pack(*state, gauss is not None, gauss or 0.0))
+    return b"".join(parts)
+
+
+def _read(data, board):
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError("not a Monopoly snapshot")
+    offset = len(MAGIC)
+
+    def need(n):
+        # Every read is checked first, so a cut-off file is a ValueError rather than a struct.error.
+        if offset + n > len(data):
+            raise ValueError("truncated snapshot")
+
+    need(HEADER.size)
+    version, snapshot_board, turns, current, count, size, has_economy = HEADER.unpack_from(data, offset)
+    offset += HEADER.size
+    if version != VERSION:
+        raise ValueError(f"unsupported snapshot version {version}")
+    if snapshot_board != board_id(board) or size != len(board):
+        raise ValueError("snapshot was taken on a different board")
+
+    names = []
+    for _ in range(count):
+        need(NAME.size)
+        (length,) = NAME.unpack_from(data, offset)
+        offset += NAME.size
+        need(length)
+        names.append(data[offset:offset + length].decode())
+        offset += length
+
+    def take(typecode, n):
+        nonlocal offset
+        values = array(typecode)
+        need(n * values.itemsize)
+        values.frombytes(data[offset:offset + n * values.itemsize])
+        offset += n * values.itemsize
+        return values
+
+    state = {
+        "names": names, "turns": turns, "current": current,
+        "player_nums": take("I", count), "positions": take("i", count),
+        "cash": take("q", count), "bankrupt": take("B", count), "landings": take("Q", size).tolist(),
+    }
+    if has_economy:
+        state["owner"] = take("b", size)
+        state["mortgaged"] = take("B", size)
+    need(RNG.size)
+    if offset + RNG.size != len(data):
+        raise ValueError("unexpected data after the snapshot")
+    values = RNG.unpack_from(data, offset)
+    state["rng"] = (3, tuple(values[:625]), values[626] if values[625] else None)
+    return state
+
+
+def restore_into(engine, data):
+    # Puts a snapshot back into an existing engine for the same board and players.
+    state = _read(data, engine.board)
+    players = engine.players
+    if len(players) != len(state["names"]):
+        raise ValueError("snapshot has a different number of players")
+    if players.player_nums != state["player_nums"]:
+        raise ValueError("snapshot has different player numbers")
+    if (engine.economy is not None) != ("owner" in state):
+        raise ValueError("snapshot was taken with the economy " + ("off" if engine.economy is not None else "on"))
+    players.positions[:] = state["positions"]
+    players.cash[:] = state["cash"]
+    players.bankrupt[:] = state["bankrupt"]
+    engine.landings[:] = state["landings"]
+    engine.turns = state["turns"]
+    engine.current_player_index = state["current"]
+    engine.rng.setstate(state["rng"])
+    if engine.economy is not None:
+        engine.economy.load_ownership(state["owner"], state["mortgaged"])
+    return engine
+
+
+def load(data, board):
+    # Builds a new headless engine from a snapshot.
+    state = _read(data, board)
+    players = PlayerStore(state["names"], state["player_nums"])
+    economy = Economy(board, players) if "owner" in state else None
+    return restore_into(MonopolyEngine(players, board, economy=economy), data)
+
+
+def write_snapshot(engine, path):
+    # Written next to the target and renamed over it, so a crash never leaves half a file.
+    temporary = f"{path}.tmp"
+    with open(temporary, mode="wb") as file:
+        file.write(save(engine))
+    os.replace(temporary, path)
+
+
+def read_snapshot(path, board):
+    with open(path, mode="rb") as file:
+        return load(file.read(), board)
+
+
+def run_checkpointed(engine, total_turns, path, checkpoint_every=1_000_000):
+    # Plays until the engine has made total_turns turns, saving a checkpoint every
+    # checkpoint_every turns. Chunked runs consume the dice exactly like one long run,
+    # so resuming from the checkpoint gives the same result as never stopping.
+    while engine.turns < total_turns:
+        before = engine.turns
+        engine.run(min(checkpoint_every, total_turns - engine.turns))
+        write_snapshot(engine, path)
+        if engine.turns == before:
+            break  # The game is over (only one player left).
+    return engine
+
+
+def resume_or_start(path, board, new_engine):
+    # Picks up a killed run from its checkpoint, or starts the engine new_engine() builds.
+    if os.path.exists(path):
+        return read_snapshot(path, board)
+    return new_engine()
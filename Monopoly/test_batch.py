@@ -0,0 +1,18 @@
+import pytest
+
+from engine import MonopolyEngine
+from players import PlayerStore
+
+np = pytest.importorskip("numpy")
+from batch import BatchSimulator  # noqa: E402
+
+
+def test_single_game_matches_engine():
+    # One game in the batch simulator is the scalar engine with the same seed, turn for turn.
+    engine = MonopolyEngine(PlayerStore.numbered(4), seed=7)
+    engine.run(10_000)
+    batch = BatchSimulator(1, 4, seed=7)
+    batch.run(10_000, chunk_size=999)  # A chunk size that does not divide the turns.
+    assert batch.landings.tolist() == list(engine.landings)
+    assert batch.positions[0].tolist() == engine.players.positions.tolist()
+    assert batch.current_player_index == engine.current_player_index
@@ -0,0 +1,12 @@
+from board import mauritian_slots
+from economy import Economy
+from players import PlayerStore
+
+
+def test_group_with_a_free_slot_still_doubles_the_rent():
+    economy = Economy(mauritian_slots, PlayerStore.numbered(2))
+    assert not economy.for_sale[1]  # Flacq costs Rs 0, so Group 1 is Cpe1 and Flac1 only.
+    assert economy.buy(0, 2)
+    single = economy.rent(2, 7)
+    assert economy.buy(0, 5)
+    assert economy.rent(2, 7) == economy.rent(5, 7) == 2 * single
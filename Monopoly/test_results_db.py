@@ -0,0 +1,24 @@
+from results_db import ResultsStore
+
+
+def test_rerun_with_the_same_seed_stores_nothing_new(tmp_path):
+    with ResultsStore(str(tmp_path / "results.db")) as store:
+        assert store.simulate(30, 3, 50, seed=4, workers=1, games_per_task=7) == 30
+        assert store.simulate(40, 3, 50, seed=4, workers=1, games_per_task=9) == 10
+        assert store.game_count() == 40
+        total = store.connection.execute("SELECT SUM(count) FROM landing_totals").fetchone()[0]
+        assert total == 40 * 50
+        assert store.simulate(30, 3, 50, seed=4, workers=1) == 0
+        assert store.connection.execute("SELECT SUM(count) FROM landing_totals").fetchone()[0] == total
+    with ResultsStore(str(tmp_path / "results.db")) as store:
+        assert store.simulate(30, 3, 50, seed=4, workers=1) == 0
+        assert store.game_count() == 40
+
+
+def test_rerun_with_more_turns_keeps_separate_totals(tmp_path):
+    with ResultsStore(str(tmp_path / "results.db")) as store:
+        store.simulate(20, 3, 50, seed=4, workers=1)
+        store.simulate(20, 3, 80, seed=4, workers=1)
+        rows = store.connection.execute("SELECT turns, SUM(count) FROM landing_totals GROUP BY turns").fetchall()
+        assert rows == [(50, 20 * 50), (80, 20 * 80)]
+        assert 0 < store.landing_share("Railroad", max_turns=80) < 1
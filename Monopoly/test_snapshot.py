@@ -0,0 +1,45 @@
+import pytest
+
+from board import mauritian_slots
+from economy import Economy
+from engine import MonopolyEngine
+from players import PlayerStore
+from snapshot import load, restore_into, run_checkpointed, save
+
+
+def new_engine():
+    players = PlayerStore.numbered(4)
+    return MonopolyEngine(players, seed=3, economy=Economy(mauritian_slots, players))
+
+
+def state_of(engine):
+    return (engine.turns, engine.current_player_index, list(engine.landings), engine.players.positions.tolist(),
+            engine.players.cash.tolist(), engine.economy.owner.tolist(), engine.rng.getstate())
+
+
+def test_resumed_run_matches_uninterrupted(tmp_path):
+    # Stop after the first checkpoint, reload it and finish: same game as one straight run.
+    straight = new_engine()
+    straight.run(3000)
+    path = tmp_path / "checkpoint.bin"
+    run_checkpointed(new_engine(), 1000, path, checkpoint_every=400)
+    resumed = run_checkpointed(load(path.read_bytes(), mauritian_slots), 3000, path, checkpoint_every=400)
+    assert state_of(resumed) == state_of(straight)
+
+
+def test_truncated_snapshot_is_a_value_error():
+    data = save(new_engine())
+    for cut in (10, len(data) // 2, len(data) - 10):
+        with pytest.raises(ValueError):
+            load(data[:cut], mauritian_slots)
+
+
+def test_snapshot_without_economy_is_refused_by_an_economy_game():
+    engine = new_engine()
+    engine.run(500)
+    before = state_of(engine)
+    plain = MonopolyEngine(PlayerStore.numbered(4), seed=3)
+    plain.run(100)
+    with pytest.raises(ValueError):
+        restore_into(engine, save(plain))
+    assert state_of(engine) == before
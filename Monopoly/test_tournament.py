@@ -0,0 +1,10 @@
+from tournament import run_tournament
+
+
+def test_results_do_not_depend_on_workers():
+    # Every game has its own seed, so how games are split across workers changes nothing.
+    one = run_tournament(40, n_players=3, turns=200, seed=5, workers=1)
+    split = run_tournament(40, n_players=3, turns=200, seed=5, workers=2, games_per_task=7)
+    assert one["landings"] == split["landings"]
+    assert one["finishes"] == split["finishes"]
+    assert sum(one["landings"]) == 40 * 200
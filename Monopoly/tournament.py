@@ -0,0 +1,82 @@
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from board import load_board, mauritian_slots
+from engine import MonopolyEngine
+from players import PlayerStore
+
+
+def game_seed(seed, game):
+    # Every game gets its own RNG stream derived from the tournament seed and the game
+    # number only, so the results do not depend on how games are split across workers.
+    digest = hashlib.sha256(f"{seed}:{game}".encode()).digest()
+    return int.from_bytes(digest[:8], "little")
+
+
+def play_games(seed, first_game, last_game, n_players, turns, board):
+    landings = [0] * len(board)  # Landings per slot over all games in this shard.
+    finishes = [[0] * len(board) for _ in range(n_players)]  # Final slot of each player.
+    for game in range(first_game, last_game):
+        engine = MonopolyEngine(PlayerStore.numbered(n_players), board, seed=game_seed(seed, game))
+        engine.run(turns)
+        for i, count in enumerate(engine.landings):
+            landings[i] += count
+        for i, position in enumerate(engine.players.positions):
+            finishes[i][position] += 1
+    return landings, finishes
+
+
+def run_tournament(n_games, n_players=4, turns=100, seed=0, workers=None, board=mauritian_slots, games_per_task=None):
+    workers = workers or os.cpu_count() or 1
+    if games_per_task is None:
+        games_per_task = max(1, n_games // (workers * 4))  # A few tasks per worker to even out the load.
+
+    landings = [0] * len(board)
+    finishes = [[0] * len(board) for _ in range(n_players)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        shards = [
+            pool.submit(play_games, seed, first, min(first + games_per_task, n_games), n_players, turns, board)
+            for first in range(0, n_games, games_per_task)
+        ]
+        # Counts are summed, so merging in any order gives the same totals.
+        for shard in shards:
+            shard_landings, shard_finishes = shard.result()
+            for i, count in enumerate(shard_landings):
+                landings[i] += count
+            for player_finishes, shard_player in zip(finishes, shard_finishes):
+                for i, count in enumerate(shard_player):
+                    player_finishes[i] += count
+
+    return {
+        "games": n_games,
+        "players": n_players,
+        "turns": turns,
+        "seed": seed,
+        "landings": landings,
+        "finishes": finishes,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Play many headless Monopoly games across a process pool.")
+    parser.add_argument("--games", type=int, default=10_000)
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--board", help="JSON or CSV board to play on (default: the Mauritian board)")
+    args = parser.parse_args()
+    board = load_board(args.board) if args.board else mauritian_slots
+
+    start = time.perf_counter()
+    results = run_tournament(args.games, args.players, args.turns, args.seed, args.workers, board)
+    elapsed = time.perf_counter() - start
+    total = args.games * args.turns
+    print(f"{args.games} games, {total} turns in {elapsed:.2f}s ({total / elapsed:,.0f} turns/sec)")
+    landings = results["landings"]
+    for slot, count in zip(board, landings):
+        print(f"{slot['name'].strip():<12} {slot['group'].strip():<10} {count / sum(landings):.4f}")